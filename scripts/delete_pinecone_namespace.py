@@ -50,7 +50,7 @@ def verify_namespace_empty(
     for attempt in range(max_retries):
         # Query for any remaining vectors
         verification = store.index.query(
-            vector=[0] * 768,
+            vector=store.dummy_vec,
             filter={},
             top_k=1,
             include_metadata=True,
@@ -122,7 +122,7 @@ def delete_namespace(
             try:
                 # Query for all document IDs in namespace
                 response = store.index.query(
-                    vector=[0] * 768,  # Dummy vector to get IDs
+                    vector=store.dummy_vec,  # Dummy vector to get IDs
                     filter={},
                     top_k=10000,
                     include_metadata=True,
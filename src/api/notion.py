@@ -1,6 +1,6 @@
 import logging
 import time
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Iterator, List, Optional
 
 import requests
 
@@ -28,7 +28,7 @@ class NotionAPI:
         if response.status_code == 429:
             self.stats.increment_counter("rate_limit_hits")
             retry_after = int(response.headers.get("Retry-After", "5"))
-            self.stats.rate_limit_wait_time += retry_after
+            self.stats.increment_counter("rate_limit_wait_time", retry_after)
             logger.warning(f"Rate limit hit, waiting {retry_after} seconds")
             time.sleep(retry_after)
 
@@ -55,23 +55,30 @@ class NotionAPI:
                 logger.error(response.text)
                 return None
 
-    def search_pages(self) -> List[Dict[str, Any]]:
+    def search_pages(self) -> Iterator[Dict[str, Any]]:
         """Search for all pages in the workspace.
 
+        Pages are yielded as each page of search results arrives.
+
         Returns:
-            List of page objects
+            Iterator of page objects
         """
         url = "https://api.notion.com/v1/search/"
         data = {
             "query": "",
             "filter": {"value": "page", "property": "object"},
             "sort": {"direction": "ascending", "timestamp": "last_edited_time"},
+            "page_size": 100,
         }
 
         while True:
             response = requests.post(url, headers=self.headers, json=data)
             if response.status_code == 200:
-                return response.json().get("results", [])
+                results = response.json()
+                yield from results.get("results", [])
+                if not results.get("has_more"):
+                    return
+                data["start_cursor"] = results["next_cursor"]
             elif response.status_code == 429:
                 self._handle_rate_limit(response)
                 continue
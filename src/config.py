@@ -33,6 +33,16 @@ class Config:
         "NEO4J_DATABASE": os.environ.get("NEO4J_DATABASE", "notion"),
     }
 
+    # Number of pages processed concurrently during sync
+    SYNC_WORKERS = int(os.environ.get("SYNC_WORKERS", "4"))
+    if SYNC_WORKERS < 1:
+        raise ValueError(f"SYNC_WORKERS must be at least 1, got {SYNC_WORKERS}")
+
+    # On-disk embedding cache, reused across syncs. Set EMBEDDING_CACHE to
+    # false to disable it, or EMBEDDING_CACHE_PATH to move it.
+    EMBEDDING_CACHE = os.environ.get("EMBEDDING_CACHE", "true").lower() != "false"
+    EMBEDDING_CACHE_PATH: Optional[str] = os.environ.get("EMBEDDING_CACHE_PATH")
+
     _config_cache: Optional[Dict[str, Any]] = None
 
     @classmethod
@@ -54,9 +64,12 @@ class Config:
                 # Load YAML content
                 config_content = f.read()
 
-                # Replace environment variables
-                config_template = Template(config_content)
-                config_with_env = config_template.safe_substitute(os.environ)
+                # Replace environment variables, if the file references any
+                if "$" in config_content:
+                    config_template = Template(config_content)
+                    config_with_env = config_template.safe_substitute(os.environ)
+                else:
+                    config_with_env = config_content
 
                 # Parse YAML
                 cls._config_cache = yaml.safe_load(config_with_env)
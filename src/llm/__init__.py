@@ -1,6 +1,24 @@
 """Language model integration and relationship extraction module."""
 
-from .extractor import RelationshipExtractor
-from .provider import get_llm
+import importlib
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .extractor import RelationshipExtractor
+    from .provider import get_llm
+
+# Resolved on first access so importing a submodule such as .models doesn't
+# pull in every LLM provider SDK
+_LAZY_ATTRS = {
+    "RelationshipExtractor": ".extractor",
+    "get_llm": ".provider",
+}
 
 __all__ = ["get_llm", "RelationshipExtractor"]
+
+
+def __getattr__(name: str):
+    if name in _LAZY_ATTRS:
+        module = importlib.import_module(_LAZY_ATTRS[name], __name__)
+        return getattr(module, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
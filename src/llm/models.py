@@ -17,8 +17,8 @@ class TextChunk:
     summary_model: Optional[str] = None  # Model used for summary
     summary_provider: Optional[str] = None  # Provider used for summary
     embedding: Optional[List[float]] = None  # Vector embedding
-    embedding_model: Optional[str] = None  # Model used for embedding
-    embedding_provider: Optional[str] = None  # Provider used for embedding
+    embedding_model: Optional[str] = "nomic-embed-text"  # Model used for embedding
+    embedding_provider: Optional[str] = "ollama"  # Provider used for embedding
 
     def format_with_summary(self) -> str:
         """Format the chunk with summary and title in the standard format.
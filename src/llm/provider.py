@@ -47,20 +47,20 @@ class RateLimitCallback(BaseCallbackHandler):
     """Callback handler to track rate limit errors."""
 
     def __init__(self) -> None:
-        from ..utils.stats import SyncStats
+        from ..utils.stats import get_stats
 
-        self.stats = SyncStats()
+        self.stats = get_stats()
 
     def on_llm_error(
         self, error: Union[Exception, KeyboardInterrupt], **kwargs: Any
     ) -> Any:
         """Called when LLM errors."""
         if "429" in str(error):  # Rate limit response
-            self.stats.rate_limit_hits += 1
+            self.stats.increment_counter("rate_limit_hits")
             if "in" in str(error) and "seconds" in str(error):
                 try:
                     delay = float(str(error).split("in")[1].split("seconds")[0].strip())
-                    self.stats.rate_limit_wait_time += delay
+                    self.stats.increment_counter("rate_limit_wait_time", delay)
                 except (IndexError, ValueError):
                     pass  # Failed to parse delay, skip tracking it
 
@@ -1,8 +1,9 @@
 import logging
 import time
-from typing import Dict
+from threading import Lock
+from typing import Dict, Optional
 
-from ..utils.stats import SyncStats
+from ..utils.stats import get_stats
 
 logger = logging.getLogger(__name__)
 
@@ -11,12 +12,19 @@ class RateLimiter:
     """Rate limiter for LLM API calls."""
 
     _instance = None
+    _instance_lock = Lock()
+
+    _last_call_times: Dict[str, float]
+    _lock: Lock
 
     def __new__(cls):
         """Singleton pattern to ensure only one rate limiter exists."""
-        if cls._instance is None:
-            cls._instance = super(RateLimiter, cls).__new__(cls)
-            cls._instance._last_call_times: Dict[str, float] = {}
+        with cls._instance_lock:
+            if cls._instance is None:
+                instance = super(RateLimiter, cls).__new__(cls)
+                instance._last_call_times = {}
+                instance._lock = Lock()
+                cls._instance = instance
         return cls._instance
 
     def wait_if_needed(self, provider: str, delay: float) -> None:
@@ -26,23 +34,70 @@ class RateLimiter:
             provider: The LLM provider name
             delay: The configured delay in seconds
         """
-        current_time = time.time()
-        last_call = self._last_call_times.get(provider, 0)
+        with self._lock:
+            current_time = time.monotonic()
+            last_call = self._last_call_times.get(provider)
 
-        # Calculate time since last call
-        elapsed = current_time - last_call
+            # Reserve the next free slot before sleeping, so concurrent
+            # callers queue behind each other instead of all passing at once
+            call_time = (
+                current_time
+                if last_call is None
+                else max(current_time, last_call + delay)
+            )
+            self._last_call_times[provider] = call_time
 
         # Only sleep for remaining time if needed
-        if elapsed < delay:
-            remaining = delay - elapsed
+        remaining = call_time - current_time
+        if remaining > 0:
             logger.info(f"Rate limiting: sleeping for {remaining:.1f}s before LLM call")
 
             # Update stats
-            stats = SyncStats()
-            stats.rate_limit_hits += 1
-            stats.rate_limit_wait_time += remaining
+            stats = get_stats()
+            stats.increment_counter("rate_limit_hits")
+            stats.increment_counter("rate_limit_wait_time", remaining)
 
             time.sleep(remaining)
 
-        # Update last call time
-        self._last_call_times[provider] = time.time()
+
+class TokenBucket:
+    """Thread-safe token bucket limiting throughput to a fixed rate."""
+
+    def __init__(self, rate: float, capacity: Optional[float] = None):
+        """Initialize the bucket.
+
+        Args:
+            rate: Tokens replenished per second
+            capacity: Maximum burst size, defaults to one second of tokens
+        """
+        self.rate = rate
+        self.capacity = capacity or rate
+        self._tokens = self.capacity
+        self._last_refill = time.monotonic()
+        self._lock = Lock()
+
+    def consume(self, amount: float) -> float:
+        """Take tokens from the bucket, sleeping until they are available.
+
+        Args:
+            amount: Number of tokens to take; requests larger than the
+                capacity are clamped so they drain the bucket instead of
+                blocking forever
+
+        Returns:
+            Time spent waiting in seconds
+        """
+        amount = min(amount, self.capacity)
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(
+                self.capacity, self._tokens + (now - self._last_refill) * self.rate
+            )
+            self._last_refill = now
+            # Reserve the tokens now so concurrent callers queue behind us
+            self._tokens -= amount
+            wait = -self._tokens / self.rate if self._tokens < 0 else 0.0
+
+        if wait > 0:
+            time.sleep(wait)
+        return wait
@@ -1,5 +1,30 @@
 """Storage integration module for document stores."""
 
-from .pinecone import PineconeStore
+import importlib
+from typing import TYPE_CHECKING
 
-__all__ = ["PineconeStore"]
+if TYPE_CHECKING:
+    from .age import AgeStore
+    from .chroma import ChromaStore
+    from .memgraph import MemgraphStore
+    from .neo4j import Neo4jStore
+    from .pinecone import PineconeStore
+
+# Store classes are resolved on first access so importing the package
+# doesn't pull in every backend SDK
+_LAZY_STORES = {
+    "AgeStore": ".age",
+    "ChromaStore": ".chroma",
+    "MemgraphStore": ".memgraph",
+    "Neo4jStore": ".neo4j",
+    "PineconeStore": ".pinecone",
+}
+
+__all__ = list(_LAZY_STORES)
+
+
+def __getattr__(name: str):
+    if name in _LAZY_STORES:
+        module = importlib.import_module(_LAZY_STORES[name], __name__)
+        return getattr(module, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
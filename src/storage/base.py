@@ -1,10 +1,17 @@
 from abc import ABC, abstractmethod
-from typing import Dict, Iterator, List, Optional, Set
+from typing import Dict, Iterator, List, Literal, Optional, Set
+
+ChunkInputFormat = Literal["chunk", "dict", "text"]
 
 
 class DocumentStore(ABC):
     """Base interface for document stores."""
 
+    # Chunk format expected by create_chunks when called via StoreManager:
+    # "chunk" for TextChunk objects as-is, "dict" for chunk dictionaries,
+    # "text" for plain chunk text
+    chunk_input_format: ChunkInputFormat = "dict"
+
     @abstractmethod
     def clean_document(self, notion_id: str) -> None:
         """Remove all nodes and relationships for a document.
@@ -14,6 +21,20 @@ class DocumentStore(ABC):
         """
         pass
 
+    def exists(self, notion_id: str) -> bool:
+        """Check whether anything is stored for a document.
+
+        Stores without a cheap lookup assume the document exists, so callers
+        still clean it.
+
+        Args:
+            notion_id: Notion page ID
+
+        Returns:
+            True if the document may be stored, False if it is known not to be
+        """
+        return True
+
     @abstractmethod
     def create_chunks(self, notion_id: str, chunks: List[Dict]) -> None:
         """Create note chunks with consistent metadata.
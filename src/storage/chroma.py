@@ -18,6 +18,8 @@ logger = logging.getLogger(__name__)
 
 
 class ChromaStore(DocumentStore):
+    chunk_input_format = "text"
+
     def add_entity_reference(
         self, entity_name: str, notion_id: str, timestamp: str
     ) -> None:
@@ -106,6 +108,20 @@ class ChromaStore(DocumentStore):
         """
         self.delete_document(notion_id)
 
+    def exists(self, notion_id: str) -> bool:
+        """Check whether any chunks are stored for a document.
+
+        Args:
+            notion_id: Notion page ID
+
+        Returns:
+            True if the document has stored chunks
+        """
+        results = self.vector_store.get(
+            where={"notion_id": {"$eq": notion_id}}, limit=1, include=[]
+        )
+        return bool(results["ids"])
+
     def create_chunks(self, notion_id: str, chunks: List[Dict]) -> None:
         """Create note chunks with consistent metadata.
 
@@ -279,6 +295,30 @@ class ChromaStore(DocumentStore):
             return results["metadatas"][0]
         return None
 
+    def bulk_get_last_modified(self, notion_ids: List[str]) -> Dict[str, str]:
+        """Get the last_modified timestamps for several documents in one query.
+
+        Args:
+            notion_ids: Notion page IDs
+
+        Returns:
+            Dictionary of stored page IDs to last modified timestamps
+        """
+        results = self.vector_store.get(
+            where={
+                "$and": [
+                    {"notion_id": {"$in": list(notion_ids)}},
+                    {"chunk_number": {"$eq": 0}},
+                ]
+            },
+            include=["metadatas"],
+        )
+        return {
+            metadata["notion_id"]: metadata["last_modified"]
+            for metadata in results["metadatas"] or []
+            if metadata.get("last_modified")
+        }
+
     def get_note_hash(self, notion_id: str) -> Optional[str]:
         """Get the stored hash for a note.
 
@@ -70,6 +70,30 @@ class MemgraphStore(DocumentStore):
                 f"Cleaned document {notion_id} and its relationships from Memgraph"
             )
 
+    def exists(self, notion_id: str) -> bool:
+        """Check whether any chunks or references are stored for a document.
+
+        Args:
+            notion_id: Notion page ID
+
+        Returns:
+            True if the document has stored chunks or source references
+        """
+        with self.driver.session() as session:
+            result = session.run(
+                """
+                MATCH (c:NoteChunk {parentNote: $notion_id})
+                RETURN 1 as found
+                LIMIT 1
+                UNION
+                MATCH (sr:SourceReference {note_id: $notion_id})
+                RETURN 1 as found
+                LIMIT 1
+                """,
+                notion_id=notion_id,
+            )
+            return result.single() is not None
+
     def create_chunks(self, notion_id: str, chunks: List[Dict]) -> None:
         """Create note chunks with consistent metadata.
 
@@ -257,6 +281,30 @@ class MemgraphStore(DocumentStore):
             ).single()
             return result["last_modified"] if result else None
 
+    def bulk_get_last_modified(self, notion_ids: List[str]) -> Dict[str, str]:
+        """Get the last_modified timestamps for several notes in one query.
+
+        Args:
+            notion_ids: Note IDs
+
+        Returns:
+            Dictionary of stored note IDs to last modified timestamps
+        """
+        with self.driver.session() as session:
+            result = session.run(
+                """
+                UNWIND $notion_ids AS notion_id
+                MATCH (c:NoteChunk {parentNote: notion_id, chunk_number: 0})
+                RETURN notion_id, c.last_modified as last_modified
+                """,
+                notion_ids=list(notion_ids),
+            )
+            return {
+                record["notion_id"]: record["last_modified"]
+                for record in result
+                if record["last_modified"]
+            }
+
     def get_documents(self, notion_id: Optional[str] = None) -> Iterator[Dict]:
         """Get all documents or a specific document.
 
@@ -272,9 +320,7 @@ class MemgraphStore(DocumentStore):
             WHERE c.chunk_number = 0
             {}
             RETURN DISTINCT c.parentNote as notion_id, c.title as title, c.content as content
-            """.format(
-                "AND c.parentNote = $notion_id" if notion_id else ""
-            )
+            """.format("AND c.parentNote = $notion_id" if notion_id else "")
 
             params = {"notion_id": notion_id} if notion_id else {}
             result = session.run(query, params)
@@ -294,6 +340,26 @@ class MemgraphStore(DocumentStore):
                     "content": content,
                 }
 
+    def find_missing(self, notion_ids: List[str]) -> List[str]:
+        """Get IDs of stored documents that are not in the given list.
+
+        Args:
+            notion_ids: IDs of documents that still exist in Notion
+
+        Returns:
+            List of stored document IDs missing from notion_ids
+        """
+        with self.driver.session() as session:
+            result = session.run(
+                """
+                MATCH (c:NoteChunk)
+                WHERE c.chunk_number = 0 AND NOT c.parentNote IN $notion_ids
+                RETURN DISTINCT c.parentNote as notion_id
+                """,
+                notion_ids=notion_ids,
+            )
+            return [record["notion_id"] for record in result]
+
     def get_chunks(self, notion_id: str) -> List[Dict]:
         """Get all chunks for a document.
 
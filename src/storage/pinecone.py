@@ -1,20 +1,116 @@
 import logging
 import time
-import uuid
-from typing import Dict, Iterator, List, Optional, Set
-
-from pinecone import Pinecone, PineconeException
+from operator import itemgetter
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+    Set,
+    Tuple,
+    Type,
+    Union,
+)
 
 from ..config import Config
 from ..llm.models import TextChunk
+from ..llm.rate_limiter import TokenBucket
 from .base import DocumentStore
 
 logger = logging.getLogger(__name__)
 
+# Optional chunk attributes copied into vector metadata when set
+_DICT_CHUNK_FIELDS = (
+    "token_count",
+    "chunking_model",
+    "chunking_provider",
+    "summary_model",
+    "summary_provider",
+)
+_TEXT_CHUNK_FIELDS = _DICT_CHUNK_FIELDS + ("embedding_model", "embedding_provider")
+
+# Pinecone's documented per-namespace ingress limit
+_MAX_INGRESS_BYTES_PER_SEC = 50_000_000
+
+# Rough JSON size of one embedding value, used to estimate upsert payloads
+_BYTES_PER_VALUE = 20
+
+# Embedding dimension assumed when the index stats don't report one
+_DEFAULT_DIMENSION = 768
+
+# Vector metadata and embedding built from one chunk
+_PreparedChunk = Tuple[Dict, Optional[List[float]]]
+
+# Total time to wait for eventually consistent reads to reflect a write
+_VERIFY_TIMEOUT = 60.0
+
+
+def _poll_with_backoff(
+    fn: Callable[[], bool],
+    timeout: float = _VERIFY_TIMEOUT,
+    base: float = 1.3,
+    initial: float = 0.2,
+    cap: float = 30.0,
+    retry_on: Tuple[Type[Exception], ...] = (),
+) -> bool:
+    """Poll a check until it succeeds, backing off exponentially between attempts.
+
+    Each attempt is preceded by a delay of ``min(cap, initial * base**attempt)``
+    seconds, giving 0.2, 0.26, 0.34, 0.44, ... with the defaults. Polling
+    stops once the deadline has passed, so quick writes are confirmed early
+    while slow index updates still get the full timeout.
+
+    Args:
+        fn: Check to run; returns True once the expected state is observed
+        timeout: Total time to keep polling in seconds
+        base: Exponential growth factor for the delay
+        initial: Delay before the first attempt in seconds
+        cap: Upper bound on any single delay in seconds
+        retry_on: Exception types that count as a failed attempt rather than
+            aborting; re-raised if the final attempt fails
+
+    Returns:
+        True if the check succeeded before the deadline, False otherwise
+    """
+    deadline = time.monotonic() + timeout
+    attempt = 0
+    while True:
+        time.sleep(min(cap, initial * base**attempt))
+        attempt += 1
+        try:
+            if fn():
+                if attempt > 1:
+                    logger.debug("Verification succeeded on attempt %d", attempt)
+                return True
+        except retry_on:
+            if time.monotonic() >= deadline:
+                raise
+        if time.monotonic() >= deadline:
+            return False
+        logger.debug("Verification attempt %d failed", attempt)
+
+
+def _chunk_id(notion_id: str, chunk_number: int) -> str:
+    """Get the vector ID of a document chunk.
+
+    Args:
+        notion_id: Notion page ID
+        chunk_number: Position of the chunk in the document
+
+    Returns:
+        Vector ID, unique per document and chunk
+    """
+    return f"{notion_id}_{chunk_number}"
+
 
 class PineconeStore(DocumentStore):
     """Pinecone implementation of document store."""
 
+    chunk_input_format = "chunk"
+
     def __init__(self, config: Optional[Dict] = None):
         """Initialize Pinecone store with configuration.
 
@@ -28,6 +124,9 @@ class PineconeStore(DocumentStore):
             .get("settings", {})
         )
 
+        # Import the SDK lazily so disabled stores don't pay its import cost
+        from pinecone import Pinecone
+
         # Create Pinecone client instance
         api_key = store_config.get(
             "api_key", Config.REQUIRED_ENV_VARS.get("PINECONE_API_KEY")
@@ -43,8 +142,17 @@ class PineconeStore(DocumentStore):
         )
         self.index = self.pc.Index(index_name)
 
+        # Metadata-only queries need a zero vector matching the index dimension
+        stats = self.index.describe_index_stats()
+        self._dimension = getattr(stats, "dimension", None) or _DEFAULT_DIMENSION
+        self.dummy_vec: List[float] = [0.0] * self._dimension
+
+        # Upserts are capped at the ingress limit
+        self._ingress = TokenBucket(_MAX_INGRESS_BYTES_PER_SEC)
+
         logger.info(
-            f"Initialized Pinecone store with index: {index_name}, namespace: {self.namespace}"
+            f"Initialized Pinecone store with index: {index_name}, namespace: {self.namespace}, "
+            f"dimension: {self._dimension}"
         )
 
     def clean_document(self, notion_id: str) -> None:
@@ -60,7 +168,7 @@ class PineconeStore(DocumentStore):
         # Keep querying and deleting until no more vectors found
         while True:
             response = self.index.query(
-                vector=[0] * 768,  # Dummy vector to get IDs
+                vector=self.dummy_vec,  # Dummy vector to get IDs
                 filter={"notion_id": notion_id},
                 top_k=page_size,
                 include_metadata=True,
@@ -82,61 +190,156 @@ class PineconeStore(DocumentStore):
             # Small delay to prevent rate limiting
             time.sleep(0.1)
 
-        # Add delay before verification for eventual consistency
-        initial_delay = 2.0
-        time.sleep(initial_delay)
-
-        # Verify cleanup with retries
-        max_retries = 5
-        base_delay = 2.0
-
-        for attempt in range(max_retries):
+        # Verify cleanup, allowing time for eventual consistency
+        def _is_clean() -> bool:
             verification = self.index.query(
-                vector=[0] * 768,
+                vector=self.dummy_vec,
                 filter={"notion_id": notion_id},
                 top_k=1,
                 include_metadata=True,
                 namespace=self.namespace,
             )
+            return not verification.matches
 
-            if not verification.matches:
-                if attempt > 0:
-                    logger.debug(
-                        f"Document cleanup verification succeeded on attempt {attempt + 1}"
-                    )
-                break
-
-            if attempt == max_retries - 1:
-                # Last attempt failed
-                logger.error(
-                    f"Document cleanup failed after {max_retries} attempts - "
-                    f"vectors still exist for {notion_id}"
-                )
-                raise Exception(f"Failed to clean document {notion_id}")
-
-            # Wait with exponential backoff before next attempt
-            delay = base_delay * (2**attempt)
-            logger.debug(
-                f"Document cleanup verification attempt {attempt + 1} failed, "
-                f"waiting {delay}s before retry"
+        if not _poll_with_backoff(_is_clean):
+            logger.error(
+                f"Document cleanup failed after {_VERIFY_TIMEOUT:.0f} seconds - "
+                f"vectors still exist for {notion_id}"
             )
-            time.sleep(delay)
+            raise Exception(f"Failed to clean document {notion_id}")
 
         logger.info(
             f"Cleaned document {notion_id} from Pinecone - removed {total_deleted} vectors"
         )
 
+    def exists(self, notion_id: str) -> bool:
+        """Check whether any vectors are stored for a document.
+
+        Args:
+            notion_id: Notion page ID
+
+        Returns:
+            True if the document has stored vectors
+        """
+        response = self.index.query(
+            vector=self.dummy_vec,
+            filter={"notion_id": notion_id},
+            top_k=1,
+            include_metadata=False,
+            namespace=self.namespace,
+        )
+        return bool(response.matches)
+
+    def _prepare_text_chunk(
+        self, notion_id: str, chunk: TextChunk, chunk_number: int, total_chunks: int
+    ) -> _PreparedChunk:
+        """Build vector metadata for a TextChunk.
+
+        Args:
+            notion_id: Parent note ID
+            chunk: Chunk to prepare
+            chunk_number: Position of the chunk in the document
+            total_chunks: Total number of chunks in the document
+
+        Returns:
+            Tuple of metadata dictionary and embedding
+        """
+        metadata = {
+            **(getattr(chunk, "metadata", None) or {}),
+            "notion_id": notion_id,
+            "chunk_number": chunk_number,
+            "total_chunks": total_chunks,
+            "text": chunk.format_with_summary(),
+            **({"summary": chunk.summary} if chunk.summary else {}),
+            **{
+                field: value
+                for field in _TEXT_CHUNK_FIELDS
+                if (value := getattr(chunk, field, None)) is not None
+            },
+        }
+        return metadata, chunk.embedding
+
+    def _prepare_dict_chunk(
+        self, notion_id: str, chunk: Dict, chunk_number: int, total_chunks: int
+    ) -> Optional[_PreparedChunk]:
+        """Build vector metadata for a chunk dictionary.
+
+        Args:
+            notion_id: Parent note ID
+            chunk: Chunk to prepare
+            chunk_number: Fallback position if the chunk metadata has none
+            total_chunks: Total number of chunks in the document
+
+        Returns:
+            Tuple of metadata dictionary and embedding, or None if the chunk
+            has no text content
+        """
+        if "text" not in chunk:
+            logger.warning(f"Skipping chunk without text content for {notion_id}")
+            return None
+
+        metadata = chunk.get("metadata", {}).copy()
+
+        # Ensure chunk has valid chunk_number from input metadata
+        fallback_number = chunk_number
+        chunk_number = metadata.get("chunk_number")
+        if chunk_number is None or chunk_number == "":
+            chunk_number = fallback_number
+            logger.warning(
+                f"Found missing/invalid chunk_number for {notion_id}, using {chunk_number}"
+            )
+        else:
+            try:
+                chunk_number = int(chunk_number)
+            except (ValueError, TypeError):
+                chunk_number = fallback_number
+                logger.warning(
+                    f"Invalid chunk_number format for {notion_id}, using {chunk_number}"
+                )
+
+        # Format text with summary for dict input, mirroring TextChunk behavior
+        text_parts = []
+        if "summary" in chunk:
+            metadata["summary"] = chunk["summary"]
+            text_parts.extend([chunk["summary"], ""])
+
+        if "title" in chunk:
+            text_parts.extend([f"# {chunk['title']}", ""])
+
+        text_parts.append(chunk["text"])
+
+        metadata.update(
+            {
+                "notion_id": notion_id,
+                "chunk_number": chunk_number,
+                "total_chunks": total_chunks,
+                "text": "\n".join(text_parts),
+            }
+        )
+
+        # Add dict fields if they exist and aren't None
+        for field in _DICT_CHUNK_FIELDS:
+            if chunk.get(field) is not None:
+                metadata[field] = chunk[field]
+
+        return metadata, chunk.get("embedding", [])
+
     def create_chunks(
-        self, notion_id: str, chunks: List[Dict], batch_size: int = 100
+        self,
+        notion_id: str,
+        chunks: Sequence[Union[TextChunk, Dict]],
+        batch_size: int = 100,
     ) -> None:
         """Create note chunks.
 
         Args:
             notion_id: Parent note ID
-            chunks: List of chunk dictionaries
+            chunks: List of TextChunks or chunk dictionaries
             batch_size: Number of vectors to upsert in each batch
         """
-        logger.debug(f"Storing {len(chunks)} chunks in Pinecone for {notion_id}")
+        from pinecone import PineconeException
+
+        logger.debug("Storing %d chunks in Pinecone for %s", len(chunks), notion_id)
 
         if not chunks:
             logger.warning(f"No chunks provided for document {notion_id}")
@@ -146,122 +349,35 @@ class PineconeStore(DocumentStore):
         processed_chunks = 0
         chunk_ids = []
 
+        # Chunks come from a single producer, so dispatch on type once
+        prepare_chunk: Callable[[str, Any, int, int], Optional[_PreparedChunk]] = (
+            self._prepare_text_chunk
+            if isinstance(chunks[0], TextChunk)
+            else self._prepare_dict_chunk
+        )
+
         # Process chunks in batches
         for start_idx in range(0, total_chunks, batch_size):
             vectors = []
             batch = chunks[start_idx : start_idx + batch_size]
 
             for chunk in batch:
-                # First handle TextChunk objects properly
-                if isinstance(chunk, TextChunk):
-                    chunk_id = str(uuid.uuid4())
-                    chunk_ids.append(chunk_id)
-
-                    # Get the base metadata from the chunk
-                    metadata = (
-                        chunk.metadata.copy() if hasattr(chunk, "metadata") else {}
-                    )
-
-                    # Add or update required fields, including summary
-                    metadata_update = {
-                        "notion_id": notion_id,
-                        "chunk_number": processed_chunks,
-                        "total_chunks": total_chunks,
-                        "text": chunk.format_with_summary(),
-                    }
-                    if chunk.summary:
-                        metadata_update["summary"] = chunk.summary
-
-                    metadata.update(metadata_update)
-                else:
-                    # Fall back to dict handling
-                    if "text" not in chunk:
-                        logger.warning(
-                            f"Skipping chunk without text content for {notion_id}"
-                        )
-                        continue
-
-                    chunk_id = str(uuid.uuid4())
-                    chunk_ids.append(chunk_id)
-
-                    metadata = chunk.get("metadata", {}).copy()
-
-                    # Ensure chunk has valid chunk_number from input metadata
-                    chunk_number = metadata.get("chunk_number")
-                    if chunk_number is None or chunk_number == "":
-                        chunk_number = processed_chunks
-                        logger.warning(
-                            f"Found missing/invalid chunk_number for {notion_id}, using {chunk_number}"
-                        )
-                    else:
-                        try:
-                            chunk_number = int(chunk_number)
-                        except (ValueError, TypeError):
-                            chunk_number = processed_chunks
-                            logger.warning(
-                                f"Invalid chunk_number format for {notion_id}, using {chunk_number}"
-                            )
-
-                    # Format text with summary for dict input, mirroring TextChunk behavior
-                    text_parts = []
-                    if "summary" in chunk:
-                        metadata["summary"] = chunk["summary"]
-                        text_parts.extend([chunk["summary"], ""])
-
-                    if "title" in chunk:
-                        text_parts.extend([f"# {chunk['title']}", ""])
-
-                    text_parts.append(chunk["text"])
-                    formatted_text = "\n".join(text_parts)
-
-                    metadata.update(
-                        {
-                            "notion_id": notion_id,
-                            "chunk_number": chunk_number,
-                            "total_chunks": total_chunks,
-                            "text": formatted_text,
-                        }
-                    )
-
-                # Add optional metadata from either TextChunk object or dict
-                if isinstance(chunk, TextChunk):
-                    # Add TextChunk fields if they have values
-                    for field in [
-                        "token_count",
-                        "chunking_model",
-                        "chunking_provider",
-                        "summary_model",
-                        "summary_provider",
-                        "embedding_model",
-                        "embedding_provider",
-                    ]:
-                        value = getattr(chunk, field, None)
-                        if value is not None:
-                            metadata[field] = value
-                else:
-                    # Add dict fields if they exist and aren't None
-                    for field in [
-                        "token_count",
-                        "chunking_model",
-                        "chunking_provider",
-                        "summary_model",
-                        "summary_provider",
-                    ]:
-                        if chunk.get(field) is not None:
-                            metadata[field] = chunk[field]
-
-                # Get embedding (handle both TextChunk and dict)
-                if isinstance(chunk, TextChunk):
-                    embedding = chunk.embedding
-                else:
-                    embedding = chunk.get("embedding", [])
+                prepared = prepare_chunk(
+                    notion_id, chunk, processed_chunks, total_chunks
+                )
+                if prepared is None:
+                    continue
 
+                metadata, embedding = prepared
                 if not embedding:
                     logger.warning(
                         f"Skipping chunk {processed_chunks} without embedding for {notion_id}"
                     )
                     continue
 
+                chunk_id = _chunk_id(notion_id, metadata["chunk_number"])
+                chunk_ids.append(chunk_id)
+
                 vectors.append(
                     {
                         "id": chunk_id,
@@ -275,9 +391,16 @@ class PineconeStore(DocumentStore):
             # Batch upsert
             if vectors:
                 try:
+                    self._ingress.consume(
+                        sum(
+                            len(vector["values"]) * _BYTES_PER_VALUE
+                            + len(str(vector["metadata"]))
+                            for vector in vectors
+                        )
+                    )
                     self.index.upsert(vectors=vectors, namespace=self.namespace)
                     logger.debug(
-                        f"Uploaded batch of {len(vectors)} chunks for {notion_id}"
+                        "Uploaded batch of %d chunks for %s", len(vectors), notion_id
                     )
                 except Exception as e:
                     logger.error(
@@ -288,59 +411,31 @@ class PineconeStore(DocumentStore):
         # Verify all chunks were created
         if processed_chunks > 0:
             for chunk_id in chunk_ids:
-                max_retries = 5
-                base_delay = 2.0  # Start with 2 second delay
-                initial_delay = 2.0  # Initial delay before first attempt
-
-                # Add initial delay for eventual consistency
-                time.sleep(initial_delay)
-
-                for attempt in range(max_retries):
-                    try:
-                        # Use query to verify by ID
-                        response = self.index.query(
-                            vector=[0] * 768,  # Dummy vector for metadata query
-                            filter={
-                                "notion_id": notion_id,
-                                "chunk_number": processed_chunks
-                                - (len(chunk_ids) - chunk_ids.index(chunk_id)),
-                            },
-                            top_k=1,
-                            include_metadata=True,
-                            namespace=self.namespace,
-                        )
 
-                        if response.matches:
-                            if attempt > 0:
-                                logger.debug(
-                                    f"Verified chunk {chunk_id} on attempt {attempt + 1}"
-                                )
-                            break
-
-                        # If no matches found, wait with exponential backoff
-                        delay = base_delay * (2**attempt)
-                        logger.debug(
-                            f"Chunk {chunk_id} not found on attempt {attempt + 1}, "
-                            f"waiting {delay}s before retry"
-                        )
-                        time.sleep(delay)
-
-                    except PineconeException as e:
-                        if attempt == max_retries - 1:
-                            logger.error(
-                                f"Failed to verify chunk {chunk_id} after {max_retries} "
-                                f"attempts: {str(e)}"
-                            )
-                            raise
-                        delay = base_delay * (2**attempt)
-                        time.sleep(delay)
-                    except Exception as e:
-                        logger.error(
-                            f"Unexpected error verifying chunk {chunk_id}: {str(e)}"
-                        )
-                        raise
-                else:
-                    # Loop completed without finding the chunk
+                def _chunk_exists() -> bool:
+                    # Look the vector up by ID rather than with a filtered query
+                    response = self.index.fetch(
+                        ids=[chunk_id], namespace=self.namespace
+                    )
+                    return chunk_id in response.vectors
+
+                try:
+                    verified = _poll_with_backoff(
+                        _chunk_exists, retry_on=(PineconeException,)
+                    )
+                except PineconeException as e:
+                    logger.error(
+                        f"Failed to verify chunk {chunk_id} after "
+                        f"{_VERIFY_TIMEOUT:.0f} seconds: {str(e)}"
+                    )
+                    raise
+                except Exception as e:
+                    logger.error(
+                        f"Unexpected error verifying chunk {chunk_id}: {str(e)}"
+                    )
+                    raise
+
+                if not verified:
                     logger.warning(
                         f"Note creation successful but verification timed out for chunk {chunk_id}. "
                         "The document may still be available after indexing completes."
@@ -365,7 +460,7 @@ class PineconeStore(DocumentStore):
         """
         # Query for all chunks of the document
         response = self.index.query(
-            vector=[0] * 768,  # Dummy vector to get metadata
+            vector=self.dummy_vec,  # Dummy vector to get metadata
             filter={"notion_id": notion_id},
             top_k=10000,
             include_metadata=True,
@@ -375,20 +470,13 @@ class PineconeStore(DocumentStore):
         if response.matches:
             # Add relationships to all chunks' metadata
             for match in response.matches:
-                doc_id = match.id
-                metadata = match.metadata
-                metadata["relationships"] = relationships
-                metadata["relationship_timestamp"] = timestamp
-
-                # Re-upsert with updated metadata
-                self.index.upsert(
-                    vectors=[
-                        {
-                            "id": doc_id,
-                            "values": match.values,
-                            "metadata": metadata,
-                        }
-                    ],
+                # Update only the changed metadata keys, leaving the vector as is
+                self.index.update(
+                    id=match.id,
+                    set_metadata={
+                        "relationships": relationships,
+                        "relationship_timestamp": timestamp,
+                    },
                     namespace=self.namespace,
                 )
 
@@ -413,7 +501,7 @@ class PineconeStore(DocumentStore):
         if not notion_id:
             # Query all chunks to get unique notion_ids
             response = self.index.query(
-                vector=[0] * 768,  # Dummy vector for metadata query
+                vector=self.dummy_vec,  # Dummy vector for metadata query
                 filter={},
                 top_k=10000,
                 include_metadata=True,
@@ -446,7 +534,7 @@ class PineconeStore(DocumentStore):
         for nid in notion_ids:
             try:
                 response = self.index.query(
-                    vector=[0] * 768,
+                    vector=self.dummy_vec,
                     filter={"notion_id": nid, "chunk_number": 0},
                     top_k=1,
                     include_metadata=True,
@@ -475,6 +563,29 @@ class PineconeStore(DocumentStore):
                 logger.warning(f"Error fetching document {nid}: {str(e)}")
                 continue
 
+    def bulk_get_last_modified(self, notion_ids: List[str]) -> Dict[str, str]:
+        """Get the stored last_modified timestamps for several documents.
+
+        Args:
+            notion_ids: Notion page IDs to look up
+
+        Returns:
+            Dictionary of stored Notion page IDs to last_modified timestamps
+        """
+        if not notion_ids:
+            return {}
+
+        # Fetch each document's first chunk by ID instead of running a query
+        response = self.index.fetch(
+            ids=[_chunk_id(notion_id, 0) for notion_id in notion_ids],
+            namespace=self.namespace,
+        )
+        return {
+            vector.metadata["notion_id"]: vector.metadata["last_modified"]
+            for vector in response.vectors.values()
+            if vector.metadata and "last_modified" in vector.metadata
+        }
+
     def get_chunks(self, notion_id: str) -> List[Dict]:
         """Get all chunks for a document.
 
@@ -486,7 +597,7 @@ class PineconeStore(DocumentStore):
         """
         # Query for chunks with matching notion_id
         response = self.index.query(
-            vector=[0] * 768,  # Dummy vector to get metadata
+            vector=self.dummy_vec,  # Dummy vector to get metadata
             filter={"notion_id": notion_id},
             top_k=10000,
             include_metadata=True,
@@ -509,8 +620,9 @@ class PineconeStore(DocumentStore):
 
             chunks.append(chunk_dict)
 
-        # Sort by chunk number and return
-        return sorted(chunks, key=lambda x: x["chunk_number"])
+        # Sort by chunk number in place and return
+        chunks.sort(key=itemgetter("chunk_number"))
+        return chunks
 
     def add_entity_reference(
         self, entity_name: str, notion_id: str, timestamp: str
@@ -524,7 +636,7 @@ class PineconeStore(DocumentStore):
         """
         # Query for all chunks by notion_id
         response = self.index.query(
-            vector=[0] * 768,  # Dummy vector to get metadata
+            vector=self.dummy_vec,  # Dummy vector to get metadata
             filter={"notion_id": notion_id},
             top_k=10000,
             include_metadata=True,
@@ -534,23 +646,13 @@ class PineconeStore(DocumentStore):
         if response.matches:
             # Update all chunks with entity reference
             for match in response.matches:
-                doc_id = match.id
-                metadata = match.metadata
-
-                if "entity_references" not in metadata:
-                    metadata["entity_references"] = {}
-
-                metadata["entity_references"][entity_name] = timestamp
-
-                # Re-upsert with updated metadata
-                self.index.upsert(
-                    vectors=[
-                        {
-                            "id": doc_id,
-                            "values": match.values,
-                            "metadata": metadata,
-                        }
-                    ],
+                entity_references = dict(match.metadata.get("entity_references") or {})
+                entity_references[entity_name] = timestamp
+
+                # Update only the changed metadata key, leaving the vector as is
+                self.index.update(
+                    id=match.id,
+                    set_metadata={"entity_references": entity_references},
                     namespace=self.namespace,
                 )
 
@@ -569,7 +671,7 @@ class PineconeStore(DocumentStore):
         """
         # Query for all chunks by notion_id
         response = self.index.query(
-            vector=[0] * 768,  # Dummy vector to get metadata
+            vector=self.dummy_vec,  # Dummy vector to get metadata
             filter={"notion_id": notion_id},
             top_k=10000,
             include_metadata=True,
@@ -585,21 +687,13 @@ class PineconeStore(DocumentStore):
 
             # Remove references from all chunks
             for match in response.matches:
-                doc_id = match.id
-                metadata = match.metadata
-
-                if "entity_references" in metadata:
-                    del metadata["entity_references"]
-
-                # Re-upsert without the references
-                self.index.upsert(
-                    vectors=[
-                        {
-                            "id": doc_id,
-                            "values": match.values,
-                            "metadata": metadata,
-                        }
-                    ],
+                if not match.metadata.get("entity_references"):
+                    continue
+
+                # Clear only the references key, leaving the vector as is
+                self.index.update(
+                    id=match.id,
+                    set_metadata={"entity_references": {}},
                     namespace=self.namespace,
                 )
 
@@ -1,8 +1,9 @@
+import importlib
 import logging
 import os
 from pathlib import Path
 from string import Template
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Tuple
 
 import yaml
 
@@ -10,6 +11,22 @@ from .base import DocumentStore
 
 logger = logging.getLogger(__name__)
 
+# Prefer libyaml's C parser when PyYAML was built with it
+try:
+    from yaml import CSafeLoader as _Loader
+except ImportError:
+    from yaml import SafeLoader as _Loader  # type: ignore[assignment]
+
+
+# Supported stores as (config key, module, class name, display name)
+_STORE_REGISTRY: List[Tuple[str, str, str, str]] = [
+    ("chroma", "chroma", "ChromaStore", "ChromaDB"),
+    ("neo4j", "neo4j", "Neo4jStore", "Neo4j"),
+    ("memgraph", "memgraph", "MemgraphStore", "Memgraph"),
+    ("age", "age", "AgeStore", "Apache AGE"),
+    ("pinecone", "pinecone", "PineconeStore", "Pinecone"),
+]
+
 
 class StoreManager:
     """Manages multiple document stores."""
@@ -26,6 +43,11 @@ class StoreManager:
             if isinstance(config_input, dict)
             else self._load_config(config_input)
         )
+        self._doc_stores_cfg: Dict = self.config.get("document_stores", {})
+        self._store_cfgs: Dict[str, Dict] = {
+            store_name: self._doc_stores_cfg.get(store_name, {})
+            for store_name, _, _, _ in _STORE_REGISTRY
+        }
         self._initialize_stores()
 
     def _load_config(self, config_path: Optional[str]) -> dict:
@@ -44,68 +66,66 @@ class StoreManager:
 
         try:
             with open(config_path) as f:
-                # Load YAML content
                 config_content = f.read()
 
-                # Replace environment variables
+            # Replace environment variables, if the file references any
+            if "$" in config_content:
                 config_template = Template(config_content)
                 config_with_env = config_template.safe_substitute(os.environ)
+            else:
+                config_with_env = config_content
 
-                # Parse YAML
-                return yaml.safe_load(config_with_env)
+            # Parse YAML
+            return yaml.load(config_with_env, Loader=_Loader)
         except Exception as e:
             logger.error(f"Error loading config from {config_path}: {str(e)}")
             raise
 
     def _initialize_stores(self) -> None:
         """Initialize enabled document stores based on configuration."""
-        store_configs = self.config.get("document_stores", {})
-
-        # Initialize each enabled store
-        if store_configs.get("chroma", {}).get("enabled", False):
-            try:
-                from .chroma import ChromaStore
-
-                self.stores["chroma"] = ChromaStore(config=self.config)
-                logger.info("Initialized ChromaDB store")
-            except Exception as e:
-                logger.error(f"Failed to initialize ChromaDB store: {str(e)}")
-
-        if store_configs.get("neo4j", {}).get("enabled", False):
-            try:
-                from .neo4j import Neo4jStore
-
-                self.stores["neo4j"] = Neo4jStore(config=self.config)
-                logger.info("Initialized Neo4j store")
-            except Exception as e:
-                logger.error(f"Failed to initialize Neo4j store: {str(e)}")
-
-        if store_configs.get("memgraph", {}).get("enabled", False):
-            try:
-                from .memgraph import MemgraphStore
-
-                self.stores["memgraph"] = MemgraphStore(config=self.config)
-                logger.info("Initialized Memgraph store")
-            except Exception as e:
-                logger.error(f"Failed to initialize Memgraph store: {str(e)}")
+        # Initialize each enabled store, importing its module only when needed
+        for store_name, module_name, class_name, label in _STORE_REGISTRY:
+            if not self._store_cfgs[store_name].get("enabled", False):
+                continue
 
-        if store_configs.get("age", {}).get("enabled", False):
             try:
-                from .age import AgeStore
-
-                self.stores["age"] = AgeStore(config=self.config)
-                logger.info("Initialized Apache AGE store")
+                module = importlib.import_module(f".{module_name}", __package__)
+                store_class = getattr(module, class_name)
+                self.stores[store_name] = store_class(config=self.config)
+                logger.info(f"Initialized {label} store")
             except Exception as e:
-                logger.error(f"Failed to initialize Apache AGE store: {str(e)}")
+                logger.error(f"Failed to initialize {label} store: {str(e)}")
+
+        # Support for relationships is fixed by config, so resolve it once
+        self._relationship_stores: List[str] = [
+            store_name
+            for store_name in self.stores
+            if self._store_cfgs[store_name].get("supports_relationships", False)
+        ]
+
+    def _for_each_store(
+        self,
+        method_name: str,
+        *args,
+        done: str,
+        failed: str,
+        store_names: Optional[List[str]] = None,
+    ) -> None:
+        """Call a method on each store, logging and tolerating failures.
 
-        if store_configs.get("pinecone", {}).get("enabled", False):
+        Args:
+            method_name: Name of the store method to call
+            *args: Arguments passed to the method
+            done: Message logged on success, followed by the store name
+            failed: Message logged on failure, followed by the store name
+            store_names: Stores to call, or None for all stores
+        """
+        for store_name in self.stores if store_names is None else store_names:
             try:
-                from .pinecone import PineconeStore
-
-                self.stores["pinecone"] = PineconeStore(config=self.config)
-                logger.info("Initialized Pinecone store")
+                getattr(self.stores[store_name], method_name)(*args)
+                logger.info(f"{done} {store_name}")
             except Exception as e:
-                logger.error(f"Failed to initialize Pinecone store: {str(e)}")
+                logger.error(f"{failed} {store_name}: {str(e)}")
 
     def clean_document(self, notion_id: str) -> None:
         """Remove document from all stores.
@@ -113,12 +133,12 @@ class StoreManager:
         Args:
             notion_id: Notion page ID
         """
-        for store_name, store in self.stores.items():
-            try:
-                store.clean_document(notion_id)
-                logger.info(f"Cleaned document {notion_id} from {store_name}")
-            except Exception as e:
-                logger.error(f"Failed to clean document from {store_name}: {str(e)}")
+        self._for_each_store(
+            "clean_document",
+            notion_id,
+            done=f"Cleaned document {notion_id} from",
+            failed="Failed to clean document from",
+        )
 
     def create_chunks(self, notion_id: str, chunks: List[Dict]) -> None:
         """Create chunks in all stores.
@@ -127,16 +147,18 @@ class StoreManager:
             notion_id: Parent note ID
             chunks: List of chunk dictionaries for graph stores, or text chunks for vector stores
         """
-        for store_name, store in self.stores.items():
-            try:
-                from ..llm.models import TextChunk
-
-                # Convert chunks to the appropriate format for each store type
-                processed_chunks = []
-                for chunk in chunks:
-                    if isinstance(chunk, TextChunk):
-                        # For TextChunks, extract metadata
-                        chunk_dict = {
+        from ..llm.models import TextChunk
+
+        input_formats = {store.chunk_input_format for store in self.stores.values()}
+
+        # Convert chunks once for every store that needs plain dictionaries
+        processed_chunks: List[Dict] = []
+        if input_formats - {"chunk"}:
+            for chunk in chunks:
+                if isinstance(chunk, TextChunk):
+                    # For TextChunks, extract metadata
+                    processed_chunks.append(
+                        {
                             "text": chunk.text,
                             "summary": chunk.summary,
                             "token_count": chunk.token_count,
@@ -146,26 +168,27 @@ class StoreManager:
                             "embedding_model": chunk.embedding_model,
                             "embedding_provider": chunk.embedding_provider,
                         }
-                        processed_chunks.append(chunk_dict)
-                    elif isinstance(chunk, dict):
-                        # For dictionary chunks, use as-is
-                        processed_chunks.append(chunk)
-                    else:
-                        # For raw text chunks, wrap in dict
-                        processed_chunks.append({"text": str(chunk)})
-
-                if store.__class__.__name__ in ["ChromaStore", "PineconeStore"]:
-                    # For vector stores, we need the appropriate format
-                    if store.__class__.__name__ == "ChromaStore":
-                        # ChromaStore only needs text content
-                        text_chunks = [chunk["text"] for chunk in processed_chunks]
-                        store.create_chunks(notion_id, text_chunks)
-                    else:
-                        # PineconeStore needs full chunk dictionaries
-                        store.create_chunks(notion_id, processed_chunks)
+                    )
+                elif isinstance(chunk, dict):
+                    # For dictionary chunks, use as-is
+                    processed_chunks.append(chunk)
                 else:
-                    # For graph stores, pass all metadata
-                    store.create_chunks(notion_id, processed_chunks)
+                    # For raw text chunks, wrap in dict
+                    processed_chunks.append({"text": str(chunk)})
+
+        payloads = {
+            "chunk": chunks,
+            "dict": processed_chunks,
+            "text": (
+                [chunk["text"] for chunk in processed_chunks]
+                if "text" in input_formats
+                else []
+            ),
+        }
+
+        for store_name, store in self.stores.items():
+            try:
+                store.create_chunks(notion_id, payloads[store.chunk_input_format])
                 logger.info(f"Created chunks for {notion_id} in {store_name}")
             except Exception as e:
                 logger.error(f"Failed to create chunks in {store_name}: {str(e)}")
@@ -180,19 +203,15 @@ class StoreManager:
             relationships: List of relationships
             timestamp: When the relationships were created
         """
-        for store_name, store in self.stores.items():
-            # Skip stores that don't support relationships
-            store_config = self.config.get("document_stores", {}).get(store_name, {})
-            if not store_config.get("supports_relationships", False):
-                continue
-
-            try:
-                store.create_relationships(notion_id, relationships, timestamp)
-                logger.info(f"Created relationships for {notion_id} in {store_name}")
-            except Exception as e:
-                logger.error(
-                    f"Failed to create relationships in {store_name}: {str(e)}"
-                )
+        self._for_each_store(
+            "create_relationships",
+            notion_id,
+            relationships,
+            timestamp,
+            done=f"Created relationships for {notion_id} in",
+            failed="Failed to create relationships in",
+            store_names=self._relationship_stores,
+        )
 
     def get_note_hash(self, notion_id: str) -> Optional[str]:
         """Get note hash from any available store.
@@ -214,12 +233,9 @@ class StoreManager:
 
     def close(self) -> None:
         """Close all store connections."""
-        for store_name, store in self.stores.items():
-            try:
-                store.close()
-                logger.info(f"Closed connection to {store_name}")
-            except Exception as e:
-                logger.error(f"Error closing {store_name} connection: {str(e)}")
+        self._for_each_store(
+            "close", done="Closed connection to", failed="Error closing connection to"
+        )
 
     def get_store(self, store_name: str) -> Optional[DocumentStore]:
         """Get a specific document store by name.
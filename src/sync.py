@@ -1,41 +1,146 @@
 import logging
 import time
+from concurrent.futures import Future, ThreadPoolExecutor
 from datetime import datetime
-from typing import Dict, Optional, Set, Union
-
-from langchain_ollama import OllamaEmbeddings
+from functools import partial
+from threading import BoundedSemaphore, Lock
+from typing import TYPE_CHECKING, Callable, Dict, List, Optional, Set, TypedDict
 
 from .api.notion import NotionAPI
 from .config import Config
-from .llm.extractor import RelationshipExtractor
 from .storage.store_manager import StoreManager
 from .utils.stats import get_stats
-from .utils.text import clean_markdown, should_skip_document, split_text
+from .utils.text import (
+    clean_markdown,
+    close_embeddings,
+    should_skip_document,
+    split_text,
+)
+
+if TYPE_CHECKING:
+    from .llm.extractor import RelationshipExtractor
 
 logger = logging.getLogger(__name__)
 
+# Pages whose stored timestamps are prefetched together, matching the size
+# of a Notion search response
+_PREFETCH_BATCH_SIZE = 100
+
+# Stores whose stored timestamps are compared against Notion's
+_TIMESTAMPED_STORES = ("memgraph", "chroma", "pinecone")
+
+# Title, chunk count and source reference count of each stored document,
+# keyed by the parentNote of its chunks since Memgraph holds no Note nodes
+_DELETION_IMPACT_QUERY = """
+UNWIND $notion_ids AS notion_id
+MATCH (c:NoteChunk {parentNote: notion_id})
+WITH notion_id, head(collect(c.title)) AS title, count(c) AS chunk_count
+OPTIONAL MATCH (sr:SourceReference {note_id: notion_id})
+RETURN notion_id, title, chunk_count, count(sr) AS ref_count
+"""
+
+
+class _UpdateInfo(TypedDict):
+    """Result of checking whether a page needs syncing."""
+
+    needs_update: bool
+    store_statuses: Dict[str, bool]
+    notion_last_updated: Optional[str]
+
+
+def _normalize_ts(value: str) -> str:
+    """Normalize a timestamp to the format stored in document metadata.
+
+    Timestamps in this format sort the same as the times they represent, so
+    they can be compared as strings without parsing.
+
+    Args:
+        value: Notion timestamp such as 2024-01-31T12:00:00.000Z, or a stored
+            timestamp such as 2024-01-31 12:00:00.000000
+
+    Returns:
+        Timestamp string such as 2024-01-31 12:00:00.000000
+
+    Raises:
+        ValueError: If the value is not a timestamp in either format
+    """
+    date_time, _, fraction = value.replace("T", " ").rstrip("Z").partition(".")
+    if len(date_time) != 19 or not fraction.isdigit():
+        raise ValueError(f"Invalid timestamp: {value!r}")
+    return f"{date_time}.{fraction[:6].ljust(6, '0')}"
+
+
+def _format_timestamp(value: datetime) -> str:
+    """Format a datetime as stored in document metadata.
+
+    Args:
+        value: Datetime to format
+
+    Returns:
+        Timestamp string such as 2024-01-31 12:00:00.000000
+    """
+    return value.isoformat(sep=" ", timespec="microseconds")
+
 
 class NotionSync:
     def __init__(self):
         self.stats = get_stats()
         self.notion = NotionAPI(stats=self.stats)
         self.store_manager = StoreManager()
-        self.embeddings = OllamaEmbeddings(
-            base_url=f"https://{Config.REQUIRED_ENV_VARS['OLLAMA_HOST']}",
-            model="nomic-embed-text",
-        )
-        self.extractor = None
 
-    def _process_page(self, page_id: str, page_data: dict) -> None:
+        # Relationship settings are fixed by config, so resolve them once
+        config = self.store_manager.config
+        self._relext_enabled: bool = config.get("relationship_extraction", {}).get(
+            "enabled", False
+        )
+        self._store_supports_rel: Dict[str, bool] = {
+            store_name: store_config.get("supports_relationships", False)
+            for store_name, store_config in config.get("document_stores", {}).items()
+        }
+
+        # Page writers for the enabled stores that sync knows how to update
+        writers = {
+            "pinecone": self._write_pinecone,
+            "memgraph": self._write_memgraph,
+            "chroma": self._write_chroma,
+        }
+        self._writers: Dict[str, Callable[..., None]] = {
+            store_name: writer
+            for store_name, writer in writers.items()
+            if store_name in self.store_manager.stores
+        }
+
+        self.extractor: Optional["RelationshipExtractor"] = None
+        self._extractor_lock = Lock()
+
+    def _process_page(
+        self,
+        page_id: str,
+        page_data: dict,
+        timestamp_cache: Optional[Dict[str, Dict[str, str]]] = None,
+    ) -> None:
         """Process a single Notion page.
 
         Args:
             page_id: Notion page ID
             page_data: Page data from Notion API
+            timestamp_cache: Optional prefetched last_modified timestamps per store
         """
         # Get page content and metadata
         title = self.notion.get_page_title(page_data)
         logger.info(f"Starting to process document: {title} ({page_id})")
+
+        # Check which stores need updating
+        update_info = self._should_update_document(page_data, page_id, timestamp_cache)
+        if not update_info["needs_update"]:
+            logger.info(f"Document is up to date in all stores: {title} ({page_id})")
+            self.stats.increment_counter("documents_processed")
+            logger.info(
+                f"{self.stats.get_processed_total()} of {self.stats.total_documents} files processed"
+            )
+            return
+
+        # Only fetch the page's blocks once we know a store needs them
         markdown_content = self.notion.get_page_markdown(page_id)
 
         if not markdown_content:
@@ -44,8 +149,7 @@ class NotionSync:
             self.stats.increment_counter("documents_errored")
             return
 
-        markdown_content = clean_markdown(markdown_content)
-
+        # Cleaning never adds or removes the skip marker, so check it first
         if should_skip_document(markdown_content):
             logger.warning(f"Skipping page marked with #skip: {title} ({page_id})")
             self._clean_empty_document(page_id)
@@ -56,15 +160,7 @@ class NotionSync:
             )
             return
 
-        # Check which stores need updating
-        update_info = self._should_update_document(page_data, page_id)
-        if not update_info["needs_update"]:
-            logger.info(f"Document is up to date in all stores: {title} ({page_id})")
-            self.stats.increment_counter("documents_processed")
-            logger.info(
-                f"{self.stats.get_processed_total()} of {self.stats.total_documents} files processed"
-            )
-            return
+        markdown_content = clean_markdown(markdown_content)
 
         store_statuses = update_info["store_statuses"]
         updating_stores = [
@@ -74,40 +170,27 @@ class NotionSync:
             f"Updating document in stores {updating_stores}: {title} ({page_id})"
         )
 
-        # Get last modified time with fallback to current time
-        try:
-            last_modified = page_data.get("last_edited_time")
-            if not last_modified:
-                raise ValueError("No last_edited_time in page data")
-            # Convert Notion's ISO format to our datetime string format
-            last_modified = datetime.strptime(
-                last_modified, "%Y-%m-%dT%H:%M:%S.%fZ"
-            ).strftime("%Y-%m-%d %H:%M:%S.%f")
-        except (ValueError, TypeError, KeyError) as e:
-            logger.warning(
-                f"Could not parse last_edited_time, using current time: {str(e)}"
-            )
-            last_modified = datetime.now().strftime("%Y-%m-%d %H:%M:%S.%f")
-
-        # Generate embeddings and extract relationships
-        embedding = self.embeddings.embed_query(f"# {title}\n\n{markdown_content}")
+        # Reuse the timestamp normalized by the update check, falling back to now
+        last_modified = update_info["notion_last_updated"]
+        if last_modified is None:
+            logger.warning("Could not parse last_edited_time, using current time")
+            last_modified = _format_timestamp(datetime.now())
 
-        # Only extract relationships if enabled globally and any store supports them
+        # Only extract relationships if enabled globally and a store being
+        # updated supports them
         relationships = []
-        if self.store_manager.config.get("relationship_extraction", {}).get(
-            "enabled", False
+        if self._relext_enabled and any(
+            self._store_supports_rel.get(store_name, False)
+            for store_name in updating_stores
         ):
-            supports_relationships = any(
-                store_config.get("supports_relationships", False)
-                for store_config in self.store_manager.config.get(
-                    "document_stores", {}
-                ).values()
-            )
-            if supports_relationships:
-                # Initialize extractor only when needed
-                if self.extractor is None:
-                    self.extractor = RelationshipExtractor()
-                relationships = self.extractor.process_document(title, markdown_content)
+            # Initialize extractor only when needed, once across workers
+            if self.extractor is None:
+                with self._extractor_lock:
+                    if self.extractor is None:
+                        from .llm.extractor import RelationshipExtractor
+
+                        self.extractor = RelationshipExtractor()
+            relationships = self.extractor.process_document(title, markdown_content)
 
         try:
             # Only clean stores that need updating
@@ -121,8 +204,6 @@ class NotionSync:
 
             # Generate chunks once to use for both storage systems
             logger.info("Generating semantic chunks...")
-            # Extract title and generate chunks
-            title = self.notion.get_page_title(page_data)
             chunks = split_text(
                 markdown_content,
                 use_semantic=True,
@@ -130,65 +211,25 @@ class NotionSync:
                 document_title=title,
             )
 
-            # Update store-specific handling
-            # Add consistent metadata to chunks
+            # Add consistent metadata to chunks, building each chunk's dict in
+            # one step from the fields shared by the whole page
+            base_metadata = {
+                "title": title,
+                "last_modified": last_modified,
+                "total_chunks": len(chunks),
+            }
             for i, chunk in enumerate(chunks):
-                # Create base metadata or copy existing
-                chunk_metadata = (
-                    chunk.metadata.copy() if hasattr(chunk, "metadata") else {}
-                )
-
-                # Update with required fields
-                chunk_metadata.update(
-                    {
-                        "title": title,
-                        "last_modified": last_modified,
-                        "total_chunks": len(chunks),
-                        "chunk_number": i,  # Ensure chunk_number is always set as an integer
-                    }
-                )
-
-                # Assign back to chunk
-                chunk.metadata = chunk_metadata
-
-                # Log warning if chunk doesn't have required metadata
-                if not isinstance(chunk_metadata.get("chunk_number"), int):
-                    logger.warning(
-                        f"Invalid chunk_number type for chunk {i} of {notion_id}"
-                    )
+                chunk.metadata = {
+                    **getattr(chunk, "metadata", {}),
+                    **base_metadata,
+                    "chunk_number": i,
+                }
 
             # Only update stores that need updating
             for store_name in updating_stores:
-                if store_name == "pinecone" and "pinecone" in self.store_manager.stores:
-                    self.store_manager.stores["pinecone"].create_chunks(page_id, chunks)
-
-                elif (
-                    store_name == "memgraph" and "memgraph" in self.store_manager.stores
-                ):
-                    self.stats.increment_counter("memgraph_nodes_created")
-                    self.store_manager.stores["memgraph"].create_chunks(page_id, chunks)
-                    self.stats.increment_counter("memgraph_nodes_created", len(chunks))
-
-                    # Only create relationships if store needs update, supports them, and we have relationships
-                    if (
-                        store_name == "memgraph"
-                        and self.store_manager.config["document_stores"][
-                            "memgraph"
-                        ].get("supports_relationships", False)
-                        and relationships
-                    ):
-                        self.store_manager.stores["memgraph"].create_relationships(
-                            page_id, relationships, last_modified
-                        )
-                        self.stats.increment_counter(
-                            "memgraph_relationships_created", len(relationships)
-                        )
-
-                elif store_name == "chroma" and "chroma" in self.store_manager.stores:
-                    self.store_manager.stores["chroma"].update_document(
-                        page_id, chunks, title, last_modified
-                    )
-                    self.stats.increment_counter("chroma_insertions", len(chunks))
+                writer = self._writers.get(store_name)
+                if writer:
+                    writer(page_id, chunks, relationships, last_modified, title)
 
             self.stats.increment_counter("documents_processed")
             logger.info(
@@ -199,14 +240,86 @@ class NotionSync:
             logger.error(f"Error processing document {page_id}: {str(e)}")
             self.stats.increment_counter("documents_errored")
 
+    def _write_pinecone(
+        self,
+        page_id: str,
+        chunks: list,
+        relationships: list,
+        last_modified: str,
+        title: str,
+    ) -> None:
+        """Write a page's chunks to Pinecone.
+
+        Args:
+            page_id: Notion page ID
+            chunks: Chunks with metadata
+            relationships: Extracted relationships (unused by Pinecone)
+            last_modified: Last modification timestamp
+            title: Page title
+        """
+        self.store_manager.stores["pinecone"].create_chunks(page_id, chunks)
+
+    def _write_memgraph(
+        self,
+        page_id: str,
+        chunks: list,
+        relationships: list,
+        last_modified: str,
+        title: str,
+    ) -> None:
+        """Write a page's chunks and relationships to Memgraph.
+
+        Args:
+            page_id: Notion page ID
+            chunks: Chunks with metadata
+            relationships: Extracted relationships
+            last_modified: Last modification timestamp
+            title: Page title
+        """
+        store = self.store_manager.stores["memgraph"]
+        store.create_chunks(page_id, chunks)
+        # One node for the note plus one per chunk
+        self.stats.increment_counter("memgraph_nodes_created", 1 + len(chunks))
+
+        # Only create relationships if the store supports them and we have some
+        if relationships and self._store_supports_rel.get("memgraph", False):
+            store.create_relationships(page_id, relationships, last_modified)
+            self.stats.increment_counter(
+                "memgraph_relationships_created", len(relationships)
+            )
+
+    def _write_chroma(
+        self,
+        page_id: str,
+        chunks: list,
+        relationships: list,
+        last_modified: str,
+        title: str,
+    ) -> None:
+        """Write a page's chunks to Chroma.
+
+        Args:
+            page_id: Notion page ID
+            chunks: Chunks with metadata
+            relationships: Extracted relationships (unused by Chroma)
+            last_modified: Last modification timestamp
+            title: Page title
+        """
+        self.store_manager.stores["chroma"].update_document(
+            page_id, chunks, title, last_modified
+        )
+        self.stats.increment_counter("chroma_insertions", len(chunks))
+
     def _clean_empty_document(self, notion_id: str) -> None:
         """Clean up empty or skipped documents from storage.
 
         Args:
             notion_id: Notion page ID
         """
-        # Clean each store individually
+        # Clean each store individually, skipping stores that never held it
         for store_name, store in self.store_manager.stores.items():
+            if not store.exists(notion_id):
+                continue
             store.clean_document(notion_id)
             if store_name == "memgraph":
                 self.stats.increment_counter("memgraph_deletions")
@@ -217,96 +330,25 @@ class NotionSync:
         self,
         page_data: dict,
         notion_id: str,
-    ) -> Dict[str, Union[bool, Dict[str, bool]]]:
+        timestamp_cache: Optional[Dict[str, Dict[str, str]]] = None,
+    ) -> _UpdateInfo:
         """Check if document needs updating based on last_modified timestamp.
 
         Args:
             page_data: Page data from Notion API
             notion_id: Notion page ID
+            timestamp_cache: Optional prefetched last_modified timestamps per
+                store, used instead of querying those stores for this page
 
         Returns:
             Dictionary containing:
                 - needs_update: True if any store needs update
                 - store_statuses: Dict of store names to update status
+                - notion_last_updated: Notion timestamp in the stored format,
+                  or None if it could not be parsed
         """
-        store_statuses = {}
         try:
-            notion_last_updated = datetime.strptime(
-                page_data["last_edited_time"], "%Y-%m-%dT%H:%M:%S.%fZ"
-            )
-
-            # Handle Memgraph store comparison
-            if "memgraph" in self.store_manager.stores:
-                try:
-                    stored_last_modified = self.store_manager.stores[
-                        "memgraph"
-                    ].get_last_modified(notion_id)
-                    needs_update = (
-                        True
-                        if not stored_last_modified
-                        else datetime.strptime(
-                            stored_last_modified, "%Y-%m-%d %H:%M:%S.%f"
-                        )
-                        < notion_last_updated
-                    )
-                    store_statuses["memgraph"] = needs_update
-                except Exception as e:
-                    logger.warning(f"Error checking Memgraph status: {str(e)}")
-                    store_statuses["memgraph"] = True
-
-            # Handle Chroma store comparison
-            if "chroma" in self.store_manager.stores:
-                try:
-                    chroma_metadata = self.store_manager.stores[
-                        "chroma"
-                    ].get_document_metadata(notion_id)
-                    needs_update = (
-                        True
-                        if not chroma_metadata
-                        else datetime.strptime(
-                            chroma_metadata["last_updated"], "%Y-%m-%d %H:%M:%S.%f"
-                        )
-                        < notion_last_updated
-                    )
-                    store_statuses["chroma"] = needs_update
-                except Exception as e:
-                    logger.warning(f"Error checking Chroma status: {str(e)}")
-                    store_statuses["chroma"] = True
-
-            # Handle Pinecone store comparison
-            if "pinecone" in self.store_manager.stores:
-                try:
-                    # Query for the document in Pinecone
-                    response = self.store_manager.stores["pinecone"].index.query(
-                        vector=[0] * 768,  # Dummy vector to get metadata
-                        filter={
-                            "notion_id": notion_id,
-                            "chunk_number": 0,
-                        },  # Main document chunk
-                        top_k=1,
-                        include_metadata=True,
-                        namespace=self.store_manager.stores["pinecone"].namespace,
-                    )
-
-                    needs_update = True
-                    if (
-                        response.matches
-                        and "last_modified" in response.matches[0].metadata
-                    ):
-                        pinecone_last_updated = datetime.strptime(
-                            response.matches[0].metadata["last_modified"],
-                            "%Y-%m-%d %H:%M:%S.%f",
-                        )
-                        needs_update = pinecone_last_updated < notion_last_updated
-                    store_statuses["pinecone"] = needs_update
-                except Exception as e:
-                    logger.warning(f"Error checking Pinecone status: {str(e)}")
-                    store_statuses["pinecone"] = True
-
-            # Determine if any store needs updating
-            needs_update = any(store_statuses.values())
-            return {"needs_update": needs_update, "store_statuses": store_statuses}
-
+            notion_last_updated = _normalize_ts(page_data["last_edited_time"])
         except (ValueError, KeyError, TypeError) as e:
             # If we can't parse dates, update all stores to be safe
             logger.warning(
@@ -315,77 +357,187 @@ class NotionSync:
             return {
                 "needs_update": True,
                 "store_statuses": {name: True for name in self.store_manager.stores},
+                "notion_last_updated": None,
             }
 
-    def find_deleted_documents(self, notion_pages: list) -> Set[str]:
+        timestamp_cache = timestamp_cache or {}
+        store_statuses = {}
+        for store_name in _TIMESTAMPED_STORES:
+            if store_name not in self.store_manager.stores:
+                continue
+            try:
+                # Use the prefetched timestamps, falling back to a lookup
+                stored = timestamp_cache.get(store_name)
+                if stored is None:
+                    stored = self.store_manager.stores[
+                        store_name
+                    ].bulk_get_last_modified([notion_id])
+                stored_last_modified = stored.get(notion_id)
+                store_statuses[store_name] = (
+                    True
+                    if not stored_last_modified
+                    else _normalize_ts(stored_last_modified) < notion_last_updated
+                )
+            except Exception as e:
+                logger.warning(f"Error checking {store_name} status: {str(e)}")
+                store_statuses[store_name] = True
+
+        # Determine if any store needs updating
+        return {
+            "needs_update": any(store_statuses.values()),
+            "store_statuses": store_statuses,
+            "notion_last_updated": notion_last_updated,
+        }
+
+    def find_deleted_documents(self, notion_ids: Set[str]) -> Set[str]:
         """Find documents that exist in storage but not in Notion.
 
         Args:
-            notion_pages: List of pages from Notion API
+            notion_ids: IDs of all pages returned by the Notion API
 
         Returns:
             Set of document IDs that should be deleted
         """
-        notion_ids = {page.get("id") for page in notion_pages if page.get("id")}
-
         if "memgraph" in self.store_manager.stores:
-            stored_ids = {
-                doc["notion_id"]
-                for doc in self.store_manager.stores["memgraph"].get_documents()
-            }
-            return stored_ids - notion_ids
+            # Let Memgraph compute the difference instead of fetching every document
+            store = self.store_manager.stores["memgraph"]
+            return set(store.find_missing(list(notion_ids)))
 
         return set()
 
-    def _get_deletion_impact(self, notion_id: str) -> Dict:
-        """Get information about what would be deleted for a document.
+    def _get_deletion_impact(self, notion_ids: Set[str]) -> Dict[str, Dict]:
+        """Get information about what would be deleted for several documents.
 
         Args:
-            notion_id: Notion page ID
+            notion_ids: Notion page IDs
 
         Returns:
-            Dict containing deletion impact information
+            Dict of Notion page IDs to deletion impact information
         """
         if "memgraph" not in self.store_manager.stores:
             return {}
 
         store = self.store_manager.stores["memgraph"]
         with store.driver.session() as session:
-            # Get note title
-            result = session.run(
-                """
-                MATCH (n:Note {id: $notion_id})
-                RETURN n.title as title
-                """,
-                notion_id=notion_id,
-            ).single()
-
-            # Count chunks
-            chunks = session.run(
-                """
-                MATCH (n:Note {id: $notion_id})-[:HAS_CHUNK]->(c:NoteChunk)
-                RETURN count(c) as chunk_count
-                """,
-                notion_id=notion_id,
-            ).single()
-
-            # Count relationships that would be affected
-            relationships = session.run(
-                """
-                MATCH (sr:SourceReference {note_id: $notion_id})
-                RETURN count(sr) as ref_count
-                """,
-                notion_id=notion_id,
-            ).single()
-
+            result = session.run(_DELETION_IMPACT_QUERY, notion_ids=list(notion_ids))
             return {
-                "title": result["title"] if result else None,
-                "chunk_count": chunks["chunk_count"] if chunks else 0,
-                "relationship_count": (
-                    relationships["ref_count"] if relationships else 0
-                ),
+                record["notion_id"]: {
+                    "title": record["title"],
+                    "chunk_count": record["chunk_count"],
+                    "relationship_count": record["ref_count"],
+                }
+                for record in result
             }
 
+    def _prefetch_timestamps(self, pages: List[dict]) -> Dict[str, Dict[str, str]]:
+        """Fetch stored timestamps for a batch of pages with one query per store.
+
+        Args:
+            pages: Pages from the Notion API
+
+        Returns:
+            Dictionary of store names to dictionaries of stored page IDs and
+            their last_modified timestamps. Stores whose lookup failed are
+            left out, so their pages are checked individually.
+        """
+        notion_ids = [page["id"] for page in pages if page.get("id")]
+        if not notion_ids:
+            return {}
+
+        timestamps = {}
+        for store_name in _TIMESTAMPED_STORES:
+            if store_name not in self.store_manager.stores:
+                continue
+            try:
+                timestamps[store_name] = self.store_manager.stores[
+                    store_name
+                ].bulk_get_last_modified(notion_ids)
+            except Exception as e:
+                logger.warning(f"Error prefetching {store_name} timestamps: {str(e)}")
+        return timestamps
+
+    def _submit_pages(
+        self,
+        executor: ThreadPoolExecutor,
+        in_flight: BoundedSemaphore,
+        pages: List[dict],
+    ) -> None:
+        """Submit a batch of pages for processing.
+
+        Blocks while the maximum number of pages is already in flight, so
+        pages are only held in memory until they are processed.
+
+        Args:
+            executor: Executor running the page workers
+            in_flight: Semaphore limiting the number of submitted pages
+            pages: Pages from the Notion API
+        """
+        timestamp_cache = self._prefetch_timestamps(pages)
+        for page in pages:
+            page_id = page.get("id")
+            if not page_id:
+                logger.error("Skipping page without an ID")
+                self.stats.increment_counter("documents_errored")
+                continue
+            in_flight.acquire()
+            future = executor.submit(self._process_page, page_id, page, timestamp_cache)
+            future.add_done_callback(partial(self._page_done, page_id, in_flight))
+
+    def _page_done(
+        self, page_id: str, in_flight: BoundedSemaphore, future: Future
+    ) -> None:
+        """Record the outcome of a processed page.
+
+        Args:
+            page_id: Notion page ID
+            in_flight: Semaphore limiting the number of submitted pages
+            future: Completed page future
+        """
+        try:
+            future.result()
+        except Exception as e:
+            logger.error(f"Error processing page {page_id}: {str(e)}")
+            self.stats.increment_counter("documents_errored")
+        finally:
+            in_flight.release()
+
+    def _report_deleted_documents(self, notion_ids: Set[str]) -> None:
+        """Log stored documents that no longer exist in Notion.
+
+        Args:
+            notion_ids: IDs of all pages returned by the Notion API
+        """
+        deleted_ids = self.find_deleted_documents(notion_ids)
+        if not deleted_ids:
+            return
+
+        # Look up every deleted document in a single round trip
+        impacts = self._get_deletion_impact(deleted_ids)
+        for notion_id in deleted_ids:
+            impact = impacts.get(notion_id, {})
+            if impact.get("title"):
+                logger.warning(
+                    f"Document deletion detected: {impact['title']} ({notion_id})\n"
+                    f"Would delete:\n"
+                    f"- {impact['chunk_count']} chunks\n"
+                    f"- {impact['relationship_count']} relationships"
+                )
+            else:
+                logger.warning(
+                    f"Document deletion detected for unknown title ({notion_id})"
+                )
+
+    def _deletion_report_done(self, future: Future) -> None:
+        """Log a failed deleted-document report without failing the sync.
+
+        Args:
+            future: Completed report future
+        """
+        try:
+            future.result()
+        except Exception as e:
+            logger.error(f"Error checking for deleted documents: {str(e)}")
+
     def sync(self) -> None:
         """Synchronize all Notion pages to configured document stores."""
         logger.info("Starting Notion sync...")
@@ -394,41 +546,40 @@ class NotionSync:
         self.stats.reset()
 
         try:
-            pages = self.notion.search_pages()
-            self.stats.total_documents = len(pages)
-            logger.info(f"Found {len(pages)} pages to process")
-
-            # Check for deleted documents
-            if "memgraph" in self.store_manager.stores:
-                deleted_ids = self.find_deleted_documents(pages)
-                for notion_id in deleted_ids:
-                    impact = self._get_deletion_impact(notion_id)
-                    if impact.get("title"):
-                        logger.warning(
-                            f"Document deletion detected: {impact['title']} ({notion_id})\n"
-                            f"Would delete:\n"
-                            f"- {impact['chunk_count']} chunks\n"
-                            f"- {impact['relationship_count']} relationships"
-                        )
-                    else:
-                        logger.warning(
-                            f"Document deletion detected for unknown title ({notion_id})"
-                        )
-
-            # Process current pages
-            for page in pages:
-                try:
-                    self._process_page(page.get("id"), page)
-                except Exception as e:
-                    logger.error(f"Error processing page {page.get('id')}: {str(e)}")
-                    self.stats.increment_counter("documents_errored")
-                    continue
+            notion_ids: Set[str] = set()
+
+            # Process pages concurrently as search results arrive, since each
+            # one is I/O bound. Only the page IDs are kept for the whole sync.
+            in_flight = BoundedSemaphore(Config.SYNC_WORKERS * 2)
+            with ThreadPoolExecutor(max_workers=Config.SYNC_WORKERS) as executor:
+                batch: List[dict] = []
+                page_count = 0
+                for page in self.notion.search_pages():
+                    page_id = page.get("id")
+                    if page_id:
+                        notion_ids.add(page_id)
+                    page_count += 1
+                    self.stats.increment_counter("total_documents")
+                    batch.append(page)
+                    if len(batch) >= _PREFETCH_BATCH_SIZE:
+                        self._submit_pages(executor, in_flight, batch)
+                        batch = []
+                self._submit_pages(executor, in_flight, batch)
+                logger.info(f"Found {page_count} pages to process")
+
+                # Check for deleted documents once every page ID is known, in
+                # the background alongside the remaining pages
+                if "memgraph" in self.store_manager.stores:
+                    executor.submit(
+                        self._report_deleted_documents, notion_ids
+                    ).add_done_callback(self._deletion_report_done)
 
         except Exception as e:
             logger.error(f"Sync failed: {str(e)}")
             raise
         finally:
             self.store_manager.close()
+            close_embeddings()
             self.stats.mark_complete()
 
         logger.info("Sync completed successfully")
@@ -0,0 +1,156 @@
+"""On-disk cache for text embeddings."""
+
+import hashlib
+import logging
+import os
+import sqlite3
+from array import array
+from pathlib import Path
+from threading import Lock
+from typing import Callable, Dict, List, Optional
+
+from langchain_core.embeddings import Embeddings
+
+logger = logging.getLogger(__name__)
+
+# Default cache location, overridden by Config.EMBEDDING_CACHE_PATH
+_CACHE_PATH = (
+    Path(os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache")
+    / "llm-notion-loader"
+    / "embeddings.sqlite3"
+)
+
+# Keep IN (...) lookups under SQLite's default bound parameter limit
+_LOOKUP_BATCH_SIZE = 500
+
+
+class CachedEmbeddings(Embeddings):
+    """Embeddings wrapper that reuses vectors stored on disk.
+
+    Vectors are keyed by a hash of the model name and the embedded text, so
+    unchanged text is never sent to the model twice and switching models
+    starts from an empty cache.
+    """
+
+    def __init__(self, embeddings: Embeddings, model: str, path: Optional[Path] = None):
+        """Initialize the cache.
+
+        Args:
+            embeddings: Embeddings model used for cache misses
+            model: Name of the embedding model, included in every cache key
+            path: Path of the SQLite cache file. If None, uses the user cache dir.
+        """
+        self.embeddings = embeddings
+        self.model = model
+        self._lock = Lock()
+
+        path = path or _CACHE_PATH
+        path.parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS embeddings "
+            "(key TEXT PRIMARY KEY, vector BLOB NOT NULL)"
+        )
+        self._conn.commit()
+
+    def _key(self, text: str) -> str:
+        """Get the cache key for a text.
+
+        Args:
+            text: Text to embed
+
+        Returns:
+            Hex digest of the model name and text
+        """
+        return hashlib.blake2b(
+            f"{self.model}\0{text}".encode(), digest_size=32
+        ).hexdigest()
+
+    def _lookup(self, keys: List[str]) -> Dict[str, List[float]]:
+        """Get cached vectors for the given keys.
+
+        Args:
+            keys: Cache keys to look up
+
+        Returns:
+            Dictionary of found keys to vectors
+        """
+        found = {}
+        for start in range(0, len(keys), _LOOKUP_BATCH_SIZE):
+            batch = keys[start : start + _LOOKUP_BATCH_SIZE]
+            placeholders = ",".join("?" * len(batch))
+            rows = self._conn.execute(
+                f"SELECT key, vector FROM embeddings WHERE key IN ({placeholders})",
+                batch,
+            )
+            for key, blob in rows:
+                found[key] = array("f", blob).tolist()
+        return found
+
+    def get_or_compute_many(
+        self,
+        texts: List[str],
+        batch_fn: Callable[[List[str]], List[List[float]]],
+    ) -> List[List[float]]:
+        """Get embeddings for texts, computing only those not yet cached.
+
+        Args:
+            texts: Texts to embed
+            batch_fn: Function embedding a list of texts in one call
+
+        Returns:
+            List of embeddings in the same order as texts
+        """
+        keys = [self._key(text) for text in texts]
+        with self._lock:
+            vectors = self._lookup(list(set(keys)))
+
+        missing = {key: text for key, text in zip(keys, texts) if key not in vectors}
+        if missing:
+            computed = batch_fn(list(missing.values()))
+            new_vectors = dict(zip(missing, computed))
+            with self._lock:
+                self._conn.executemany(
+                    "INSERT OR REPLACE INTO embeddings (key, vector) VALUES (?, ?)",
+                    [
+                        (key, array("f", vector).tobytes())
+                        for key, vector in new_vectors.items()
+                    ],
+                )
+                self._conn.commit()
+            vectors.update(new_vectors)
+
+        logger.debug(
+            f"Embedding cache: {len(texts) - len(missing)} hits, {len(missing)} misses"
+        )
+        return [vectors[key] for key in keys]
+
+    def embed_documents(self, texts: List[str]) -> List[List[float]]:
+        """Embed a list of documents, reusing cached vectors.
+
+        Args:
+            texts: Texts to embed
+
+        Returns:
+            List of embeddings
+        """
+        return self.get_or_compute_many(texts, self.embeddings.embed_documents)
+
+    def embed_query(self, text: str) -> List[float]:
+        """Embed a single query text, reusing a cached vector.
+
+        Args:
+            text: Text to embed
+
+        Returns:
+            Embedding
+        """
+        return self.get_or_compute_many(
+            [text], lambda texts: [self.embeddings.embed_query(texts[0])]
+        )[0]
+
+    def close(self) -> None:
+        """Close the cache database."""
+        with self._lock:
+            self._conn.close()
@@ -1,10 +1,24 @@
+import importlib
 import logging
 import os
+import sys
 from pathlib import Path
-from typing import Optional
+from typing import Dict, Optional, Tuple
 
 import yaml
 
+# Resolved formatter classes, keyed by their configured name
+_FORMATTER_CACHE: Dict[str, type] = {}
+
+# Parsed logging configs and their modification times, keyed by path
+_YAML_CACHE: Dict[str, Tuple[int, dict]] = {}
+
+# Prefer libyaml's C parser when PyYAML was built with it
+try:
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:
+    from yaml import SafeLoader as _YamlLoader  # type: ignore[assignment]
+
 
 class ColoredFormatter(logging.Formatter):
     """Custom formatter that adds colors to log levels"""
@@ -18,14 +32,31 @@ class ColoredFormatter(logging.Formatter):
         "RESET": "\033[0m",  # Reset
     }
 
+    def __init__(self, *args, stream=None, **kwargs):
+        """Initialize the formatter.
+
+        Args:
+            *args: Positional arguments for logging.Formatter
+            stream: Stream the formatted output is written to. Colors are only
+                    added when it is a terminal. Defaults to sys.stderr, where
+                    StreamHandler writes by default.
+            **kwargs: Keyword arguments for logging.Formatter
+        """
+        super().__init__(*args, **kwargs)
+        stream = sys.stderr if stream is None else stream
+        self._use_color = hasattr(stream, "isatty") and stream.isatty()
+
     def format(self, record):
-        # Add color to levelname
         levelname = record.levelname
-        if levelname in self.COLORS:
-            record.levelname = (
-                f"{self.COLORS[levelname]}{levelname}{self.COLORS['RESET']}"
-            )
-        return super().format(record)
+        if not self._use_color or levelname not in self.COLORS:
+            return super().format(record)
+
+        # Add color to levelname, restoring it since other handlers share the record
+        record.levelname = f"{self.COLORS[levelname]}{levelname}{self.COLORS['RESET']}"
+        try:
+            return super().format(record)
+        finally:
+            record.levelname = levelname
 
 
 def load_yaml_config(config_path: str) -> dict:
@@ -37,30 +68,41 @@ def load_yaml_config(config_path: str) -> dict:
     Returns:
         Dictionary containing logging configuration
     """
-    if os.path.exists(config_path):
-        with open(config_path, "r") as f:
-            return yaml.safe_load(f)
-    return None
+    try:
+        mtime = os.stat(config_path).st_mtime_ns
+    except FileNotFoundError:
+        return None
 
+    # Reparse only when the file changed, replacing the stale entry
+    cached = _YAML_CACHE.get(config_path)
+    if cached is not None and cached[0] == mtime:
+        return cached[1]
 
-def configure_logger(name: str, config: dict) -> None:
-    """Configure a specific logger based on YAML configuration.
+    with open(config_path, "r") as f:
+        config = yaml.load(f, Loader=_YamlLoader)
+    _YAML_CACHE[config_path] = (mtime, config)
+    return config
 
-    Args:
-        name: Logger name
-        config: Configuration dictionary from YAML
-    """
-    logger = logging.getLogger(name)
 
-    # Set default level if specified
-    if config.get("defaults", {}).get("level"):
-        logger.setLevel(config["defaults"]["level"])
+def _resolve_formatter_class(formatter_class: str) -> type:
+    """Resolve a formatter class from its configured name.
+
+    Args:
+        formatter_class: Name of a logging class or a dotted path to a custom class
 
-    # Apply specific logger configuration if it exists
-    if name in config.get("loggers", {}):
-        logger_config = config["loggers"][name]
-        if "level" in logger_config:
-            logger.setLevel(logger_config["level"])
+    Returns:
+        Formatter class
+    """
+    cls = _FORMATTER_CACHE.get(formatter_class)
+    if cls is None:
+        if "." in formatter_class:
+            # Import custom formatter class
+            module_path, class_name = formatter_class.rsplit(".", 1)
+            cls = getattr(importlib.import_module(module_path), class_name)
+        else:
+            cls = getattr(logging, formatter_class)
+        _FORMATTER_CACHE[formatter_class] = cls
+    return cls
 
 
 def setup_logging(
@@ -82,46 +124,39 @@ def setup_logging(
         config = load_yaml_config(config_path)
 
     if config:
-        # Configure root logger with handlers and formatters
-        formatters = config.get("formatters", {})
-        handlers = config.get("handlers", {})
-
-        # Set up formatters
-        configured_formatters = {}
-        for fmt_name, fmt_config in formatters.items():
-            formatter_class = fmt_config.get("class", "logging.Formatter")
-            if "." in formatter_class:
-                # Import custom formatter class
-                module_path, class_name = formatter_class.rsplit(".", 1)
-                module = __import__(module_path, fromlist=[class_name])
-                formatter_class = getattr(module, class_name)
-            else:
-                formatter_class = getattr(logging, formatter_class)
-
-            configured_formatters[fmt_name] = formatter_class(
+        default_level = config.get("defaults", {}).get("level")
+
+        # Set up formatters, failing before any handler is attached
+        configured_formatters = {
+            fmt_name: _resolve_formatter_class(
+                fmt_config.get("class", "logging.Formatter")
+            )(
                 fmt_config.get(
                     "format", "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
                 )
             )
-
-        # Set up handlers
-        for handler_name, handler_config in handlers.items():
-            handler_class_name = handler_config["class"].split(".")[
-                -1
-            ]  # Get just the class name
-            handler_class = getattr(logging, handler_class_name)
+            for fmt_name, fmt_config in config.get("formatters", {}).items()
+        }
+
+        # Set up handlers on the root logger
+        root_logger = logging.getLogger()
+        for handler_config in config.get("handlers", {}).values():
+            # Get just the class name
+            handler_class = getattr(logging, handler_config["class"].split(".")[-1])
             handler = handler_class()
 
             if "formatter" in handler_config:
                 handler.setFormatter(configured_formatters[handler_config["formatter"]])
 
-            root_logger = logging.getLogger()
             root_logger.addHandler(handler)
-            root_logger.setLevel(config.get("defaults", {}).get("level", "INFO"))
-
-        # Configure specific loggers
-        for logger_name in config.get("loggers", {}):
-            configure_logger(logger_name, config)
+        if config.get("handlers"):
+            root_logger.setLevel(default_level or "INFO")
+
+        # Configure specific loggers, falling back to the default level
+        for logger_name, logger_config in config.get("loggers", {}).items():
+            logger_level = (logger_config or {}).get("level", default_level)
+            if logger_level:
+                logging.getLogger(logger_name).setLevel(logger_level)
     else:
         # Fallback to basic configuration if no YAML config
         if level is None:
@@ -1,97 +1,267 @@
 """Statistics tracking utilities."""
 
 import time
+from array import array
 from dataclasses import dataclass, field
 from datetime import datetime
-from threading import Lock
+from enum import IntEnum
+from threading import RLock, local
+from typing import Any, Dict, List, Optional
+
+
+class _CounterIndex(IntEnum):
+    """Position of each SyncStats counter in a counter cell."""
+
+    total_documents = 0
+    documents_processed = 1
+    documents_skipped = 2
+    documents_errored = 3
+    chroma_insertions = 4
+    chroma_updates = 5
+    chroma_deletions = 6
+    memgraph_nodes_created = 7
+    memgraph_relationships_created = 8
+    memgraph_deletions = 9
+    llm_chunked_docs = 10
+    token_chunked_docs = 11
+    llm_chunks_created = 12
+    token_chunks_created = 13
+    rate_limit_hits = 14
+    rate_limit_wait_time = 15
+
+
+# Counters measuring seconds rather than counting events
+_FLOAT_COUNTERS = frozenset({_CounterIndex.rate_limit_wait_time})
+
+# Cells are packed doubles, which hold counts exactly up to 2**53
+_ZERO_CELL = array("d", bytes(8 * len(_CounterIndex)))
+
+
+def _counter_value(index: _CounterIndex, value: float) -> float:
+    """Convert a summed cell value to the counter's type.
+
+    Args:
+        index: Counter position
+        value: Summed value from the counter cells
+
+    Returns:
+        Value as a float for durations, otherwise as an int
+    """
+    return value if index in _FLOAT_COUNTERS else int(value)
+
+
+_REPORT_HEADER = (
+    "\n===== Sync Statistics =====\n"
+    "Duration: {minutes} minutes {seconds} seconds\n"
+    "Started: {start_str}\n"
+    "\n"
+    "Document Processing:\n"
+    "  - Total documents found: {total_documents}\n"
+    "  - Documents processed: {documents_processed}\n"
+    "  - Documents skipped: {documents_skipped}\n"
+    "  - Documents failed: {documents_errored}\n"
+    "\n"
+    "Database Operations:"
+)
+
+_CHROMA_REPORT = (
+    "\n  Chroma:"
+    "\n    - Insertions: {chroma_insertions}"
+    "\n    - Updates: {chroma_updates}"
+    "\n    - Deletions: {chroma_deletions}"
+)
+
+_MEMGRAPH_REPORT = (
+    "\n  Memgraph:"
+    "\n    - Nodes Created: {memgraph_nodes_created}"
+    "\n    - Relationships Created: {memgraph_relationships_created}"
+    "\n    - Deletions: {memgraph_deletions}"
+)
+
+_REPORT_FOOTER = (
+    "\n\n"
+    "Chunking:\n"
+    "  - Documents using LLM chunking: {llm_chunked_docs}\n"
+    "  - Documents using token-based: {token_chunked_docs}\n"
+    "  - Total LLM chunks created: {llm_chunks_created}\n"
+    "  - Total token-based chunks created: {token_chunks_created}\n"
+    "\n"
+    "Rate Limiting:\n"
+    "  - Number of rate limit hits: {rate_limit_hits}\n"
+    "  - Total wait time: {rate_limit_wait_time:.1f} seconds"
+)
+
+# Report templates keyed by whether the Chroma and Memgraph sections appear
+_REPORT_TEMPLATES = {
+    (has_chroma, has_memgraph): _REPORT_HEADER
+    + (_CHROMA_REPORT if has_chroma else "")
+    + (_MEMGRAPH_REPORT if has_memgraph else "")
+    + _REPORT_FOOTER
+    for has_chroma in (False, True)
+    for has_memgraph in (False, True)
+}
+
+
+class _Counter:
+    """Counter attribute of SyncStats, summed over the cells of all threads."""
+
+    def __set_name__(self, owner: type, name: str) -> None:
+        self.name = name
+        self.index = _CounterIndex[name]
+
+    def __get__(self, instance: Optional["SyncStats"], owner: type) -> Any:
+        if instance is None:
+            return self
+        return instance._read_counter(self.index)
+
+    def __set__(self, instance: "SyncStats", value: float) -> None:
+        # Read-modify-write across cells would lose concurrent increments
+        raise AttributeError(f"{self.name} is read-only; use increment_counter")
 
 
 @dataclass
 class SyncStats:
-    """Statistics for sync operations."""
+    """Statistics for sync operations.
+
+    Each thread increments its own cell of counters without locking, and
+    the cells are only summed when a counter is read, so workers never
+    contend on the hot increment path. Since every cell has a single
+    writer, this stays exact on free-threaded builds as well; the lock only
+    guards operations spanning several cells, such as reset and reports.
+    """
 
     # Runtime state (not reset between runs)
     start_time: float = field(default_factory=time.time)
     end_time: float = field(default=None)
 
     # Document statistics
-    total_documents: int = field(default=0)
-    documents_processed: int = field(default=0)
-    documents_skipped: int = field(default=0)
-    documents_errored: int = field(default=0)
+    total_documents = _Counter()
+    documents_processed = _Counter()
+    documents_skipped = _Counter()
+    documents_errored = _Counter()
 
     # Database operations (per store)
-    chroma_insertions: int = field(default=0)
-    chroma_updates: int = field(default=0)
-    chroma_deletions: int = field(default=0)
-    memgraph_nodes_created: int = field(default=0)
-    memgraph_relationships_created: int = field(default=0)
-    memgraph_deletions: int = field(default=0)
+    chroma_insertions = _Counter()
+    chroma_updates = _Counter()
+    chroma_deletions = _Counter()
+    memgraph_nodes_created = _Counter()
+    memgraph_relationships_created = _Counter()
+    memgraph_deletions = _Counter()
 
     # Chunking statistics
-    llm_chunked_docs: int = field(default=0)
-    token_chunked_docs: int = field(default=0)
-    llm_chunks_created: int = field(default=0)
-    token_chunks_created: int = field(default=0)
+    llm_chunked_docs = _Counter()
+    token_chunked_docs = _Counter()
+    llm_chunks_created = _Counter()
+    token_chunks_created = _Counter()
 
     # Rate limiting statistics
-    rate_limit_hits: int = field(default=0)
-    rate_limit_wait_time: float = field(default=0.0)
+    rate_limit_hits = _Counter()
+    rate_limit_wait_time = _Counter()
 
     def __post_init__(self):
-        """Initialize thread safety lock."""
-        self._lock = Lock()
+        """Initialize thread safety lock and per-thread counter cells."""
+        # Reentrant, since generate_report snapshots counters while holding it
+        self._lock = RLock()
+        self._local = local()
+        self._cells: List[array] = []
+        self._start_timers()
+
+    def _cell(self) -> array:
+        """Get the calling thread's counter cell, registering it on first use.
+
+        Returns:
+            Counters written only by the calling thread, indexed by
+            _CounterIndex
+        """
+        try:
+            return self._local.cell
+        except AttributeError:
+            cell = array("d", _ZERO_CELL)
+            # list.append is atomic, and readers tolerate a cell appearing
+            # mid-iteration, so registration needs no lock either
+            self._cells.append(cell)
+            self._local.cell = cell
+            return cell
+
+    def _read_counter(self, index: _CounterIndex) -> float:
+        """Sum a counter over all threads.
+
+        Args:
+            index: Counter position
+
+        Returns:
+            Current counter value
+        """
+        with self._lock:
+            return _counter_value(index, sum(cell[index] for cell in self._cells))
+
+    def _counts(self) -> Dict[str, float]:
+        """Sum every counter over all threads in a single pass.
+
+        Returns:
+            Dictionary of counter names to current values
+        """
+        with self._lock:
+            totals = [sum(column) for column in zip(*self._cells)] or _ZERO_CELL
+        return {
+            index.name: _counter_value(index, total)
+            for index, total in zip(_CounterIndex, totals)
+        }
+
+    def _start_timers(self) -> None:
+        """Record the monotonic start time and format the wall-clock one.
+
+        Durations are measured on the monotonic clock, so they can't go
+        negative when the wall clock is adjusted mid-sync.
+        """
+        self._monotonic_start = time.monotonic()
+        self._monotonic_end: Optional[float] = None
+        self._start_str = datetime.fromtimestamp(self.start_time).strftime(
+            "%Y-%m-%d %H:%M:%S"
+        )
 
     def reset(self):
         """Reset all counters to initial state."""
         with self._lock:
-            self.documents_processed = 0
-            self.documents_skipped = 0
-            self.documents_errored = 0
-            self.chroma_insertions = 0
-            self.chroma_updates = 0
-            self.chroma_deletions = 0
-            self.memgraph_nodes_created = 0
-            self.memgraph_relationships_created = 0
-            self.memgraph_deletions = 0
-            self.llm_chunked_docs = 0
-            self.token_chunked_docs = 0
-            self.llm_chunks_created = 0
-            self.token_chunks_created = 0
-            self.rate_limit_hits = 0
-            self.rate_limit_wait_time = 0.0
+            for cell in self._cells:
+                cell[:] = _ZERO_CELL
             self.start_time = time.time()
             self.end_time = None
+            self._start_timers()
 
     def get_processed_total(self) -> int:
         """Get total number of documents that have been handled (processed, skipped, or errored).
 
+        Reads the cells without locking, so the total may miss increments
+        made while it is being summed. It is only used for progress logging.
+
         Returns:
             Total number of documents handled
         """
-        with self._lock:
-            return (
-                self.documents_processed
-                + self.documents_skipped
-                + self.documents_errored
+        return int(
+            sum(
+                cell[_CounterIndex.documents_processed]
+                + cell[_CounterIndex.documents_skipped]
+                + cell[_CounterIndex.documents_errored]
+                for cell in self._cells
             )
+        )
 
-    def increment_counter(self, counter_name: str, value: int = 1) -> None:
-        """Thread-safe counter increment.
+    def increment_counter(self, counter_name: str, value: float = 1) -> None:
+        """Thread-safe counter increment, lock-free on the calling thread's cell.
 
         Args:
             counter_name: Name of the counter to increment
             value: Value to increment by (default: 1)
         """
-        with self._lock:
-            current = getattr(self, counter_name)
-            setattr(self, counter_name, current + value)
+        self._cell()[_CounterIndex[counter_name]] += value
 
     def mark_complete(self):
         """Mark sync as complete and record end time."""
         with self._lock:
             if not self.end_time:
                 self.end_time = time.time()
+                self._monotonic_end = time.monotonic()
 
     def generate_report(self) -> str:
         """Generate a formatted report of sync statistics.
@@ -103,70 +273,32 @@ class SyncStats:
         if not self.end_time:
             self.mark_complete()
 
+        # Snapshot under the lock, then format without blocking increments
         with self._lock:
-            duration = self.end_time - self.start_time
-            minutes = int(duration // 60)
-            seconds = int(duration % 60)
-
-            report = [
-                "\n===== Sync Statistics =====",
-                f"Duration: {minutes} minutes {seconds} seconds",
-                f"Started: {datetime.fromtimestamp(self.start_time).strftime('%Y-%m-%d %H:%M:%S')}",
-                "",
-                "Document Processing:",
-                f"  - Total documents found: {self.total_documents}",
-                f"  - Documents processed: {self.documents_processed}",
-                f"  - Documents skipped: {self.documents_skipped}",
-                f"  - Documents failed: {self.documents_errored}",
-                "",
-                "Database Operations:",
-            ]
-
-            # Add store stats if there were operations
-            if any(
-                [self.chroma_insertions, self.chroma_updates, self.chroma_deletions]
-            ):
-                report.extend(
-                    [
-                        "  Chroma:",
-                        f"    - Insertions: {self.chroma_insertions}",
-                        f"    - Updates: {self.chroma_updates}",
-                        f"    - Deletions: {self.chroma_deletions}",
-                    ]
-                )
-
-            if any(
-                [
-                    self.memgraph_nodes_created,
-                    self.memgraph_relationships_created,
-                    self.memgraph_deletions,
-                ]
-            ):
-                report.extend(
-                    [
-                        "  Memgraph:",
-                        f"    - Nodes Created: {self.memgraph_nodes_created}",
-                        f"    - Relationships Created: {self.memgraph_relationships_created}",
-                        f"    - Deletions: {self.memgraph_deletions}",
-                    ]
-                )
-
-            report.extend(
-                [
-                    "",
-                    "Chunking:",
-                    f"  - Documents using LLM chunking: {self.llm_chunked_docs}",
-                    f"  - Documents using token-based: {self.token_chunked_docs}",
-                    f"  - Total LLM chunks created: {self.llm_chunks_created}",
-                    f"  - Total token-based chunks created: {self.token_chunks_created}",
-                    "",
-                    "Rate Limiting:",
-                    f"  - Number of rate limit hits: {self.rate_limit_hits}",
-                    f"  - Total wait time: {self.rate_limit_wait_time:.1f} seconds",
-                ]
-            )
+            counts = self._counts()
+            start_str = self._start_str
+            duration = (self._monotonic_end or time.monotonic()) - self._monotonic_start
 
-            return "\n".join(report)
+        has_chroma = any(
+            counts[name]
+            for name in ("chroma_insertions", "chroma_updates", "chroma_deletions")
+        )
+        has_memgraph = any(
+            counts[name]
+            for name in (
+                "memgraph_nodes_created",
+                "memgraph_relationships_created",
+                "memgraph_deletions",
+            )
+        )
+        return _REPORT_TEMPLATES[has_chroma, has_memgraph].format_map(
+            {
+                **counts,
+                "minutes": int(duration // 60),
+                "seconds": int(duration % 60),
+                "start_str": start_str,
+            }
+        )
 
 
 # Create a module-level instance